@@ -10,6 +10,8 @@ Usage:
     python -m emulator --device presto --headless apps/presto/app.py
 """
 
+import threading
+
 __version__ = "0.1.0"
 
 # Global state accessible to mocks
@@ -30,6 +32,33 @@ def get_state():
     return _emulator_state
 
 
+def trace_enabled() -> bool:
+    """Return True when --trace logging is on.
+
+    Reads the state dict directly rather than caching the flag: tests and
+    the testing helpers toggle (and clear) ``_emulator_state`` in place.
+    """
+    return _emulator_state.get("trace", False)
+
+
+# Notified on every advance_frame() so waiters need not poll frame_count
+_frame_cond = threading.Condition()
+
+
+def advance_frame() -> int:
+    """Count a rendered frame and wake any wait_for_frame() callers."""
+    with _frame_cond:
+        count = _emulator_state["frame_count"] = _emulator_state.get("frame_count", 0) + 1
+        _frame_cond.notify_all()
+    return count
+
+
+def wait_for_frame(target: int, timeout: float) -> bool:
+    """Block until frame_count reaches target; False if timeout expires first."""
+    with _frame_cond:
+        return _frame_cond.wait_for(lambda: _emulator_state.get("frame_count", 0) >= target, timeout)
+
+
 def get_display():
     """Get the current display renderer."""
     return _emulator_state.get("display")
@@ -1,6 +1,6 @@
 """RGB LED simulation."""
 
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from emulator import get_state
 from emulator.devices.base import BaseDevice
@@ -14,6 +14,8 @@ class RGBLEDManager:
         self._num_leds = device.num_rgb_leds
         self._leds: List[Tuple[int, int, int]] = [(0, 0, 0)] * self._num_leds
         self._brightness = 1.0
+        # Brightness-scaled copy of _leds, rebuilt on first read after a change
+        self._scaled: Optional[List[Tuple[int, int, int]]] = None
 
     def set_led(self, index: int, r: int, g: int, b: int):
         """Set individual LED color."""
@@ -23,34 +25,41 @@ class RGBLEDManager:
                 max(0, min(255, g)),
                 max(0, min(255, b)),
             )
+            self._scaled = None
 
             if get_state().get("trace"):
                 print(f"[RGBLED] LED {index}: ({r}, {g}, {b})")
 
     def set_all(self, r: int, g: int, b: int):
         """Set all LEDs to same color."""
-        for i in range(self._num_leds):
-            self._leds[i] = (
-                max(0, min(255, r)),
-                max(0, min(255, g)),
-                max(0, min(255, b)),
-            )
+        color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
+        self._leds = [color] * self._num_leds
+        self._scaled = None
 
     def set_brightness(self, brightness: float):
         """Set global brightness (0.0 to 1.0)."""
         self._brightness = max(0.0, min(1.0, brightness))
+        self._scaled = None
 
     def get_leds(self) -> List[Tuple[int, int, int]]:
-        """Get current LED colors with brightness applied."""
-        factor = self._brightness
-        return [
-            (int(r * factor), int(g * factor), int(b * factor))
-            for r, g, b in self._leds
-        ]
+        """Get current LED colors with brightness applied.
+
+        The scaled list is cached until the next set/clear/brightness change,
+        so per-frame polling of static LEDs does no work. Callers get a copy
+        and may modify it.
+        """
+        if self._scaled is None:
+            factor = self._brightness
+            self._scaled = [
+                (int(r * factor), int(g * factor), int(b * factor))
+                for r, g, b in self._leds
+            ]
+        return list(self._scaled)
 
     def clear(self):
         """Turn off all LEDs."""
         self._leds = [(0, 0, 0)] * self._num_leds
+        self._scaled = None
 
     def rainbow(self, offset: float = 0.0):
         """Set LEDs to rainbow pattern."""
@@ -60,12 +69,15 @@ class RGBLEDManager:
             hue = (i / self._num_leds + offset) % 1.0
             r, g, b = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
             self._leds[i] = (int(r * 255), int(g * 255), int(b * 255))
+        self._scaled = None
 
     def update_from_presto(self):
         """Sync LEDs from Presto device if present."""
         state = get_state()
         presto = state.get("presto")
 
-        if presto:
+        # Only a real change invalidates the scaled cache; this runs every sync
+        if presto and (presto._leds != self._leds or presto._led_brightness != self._brightness):
             self._leds = list(presto._leds)
             self._brightness = presto._led_brightness
+            self._scaled = None
@@ -50,22 +50,25 @@ def _warn_if_shadowing_stdlib(names):
     )
 
 
+# Host-side paths that never refer to the device filesystem
+_PASSTHROUGH = ("/tmp/", "/dev/", "/proc/", "/sys/")
+
+
 def _translate_path(path: str) -> str:
     """Translate MicroPython absolute path to host filesystem path.
 
     Checks uos mount points first (e.g. /sd/), then translates known
     MicroPython device paths like /badges/, /examples/, etc.
     """
-    if not isinstance(path, str):
+    if not isinstance(path, str) or path.startswith(_PASSTHROUGH):
         return path
 
     # Check uos mount points (works even without VFS enabled)
     if path.startswith("/"):
         try:
             from emulator.mocks import uos
-            mount_points = getattr(uos, '_mount_points', {})
-            for mount_path, local_path in sorted(mount_points.items(), key=lambda x: -len(x[0])):
-                if path == mount_path or path.startswith(mount_path + "/"):
+            for mount_path, prefix, local_path in uos._mount_order:
+                if path == mount_path or path.startswith(prefix):
                     remainder = path[len(mount_path):].lstrip("/")
                     return str(Path(local_path) / remainder)
         except ImportError:
@@ -1,6 +1,14 @@
 """Base classes and helpers for mock implementations."""
 
-from emulator import get_state
+import colorsys
+from array import array
+from functools import lru_cache
+
+from emulator import get_state, trace_enabled
+
+# Buzzer audio format (matches pygame.mixer.init in the buzzer mocks)
+SAMPLE_RATE = 44100
+TONE_AMPLITUDE = 16000
 
 
 def trace_log(component: str, message: str):
@@ -10,10 +18,20 @@ def trace_log(component: str, message: str):
         component: Name of the component (e.g., "BME280", "PicoGraphics")
         message: The message to log
     """
-    if get_state().get("trace"):
+    if trace_enabled():
         print(f"[{component}] {message}")
 
 
+@lru_cache(maxsize=1024)
+def hsv_to_rgb8(h: float, s: float, v: float) -> tuple:
+    """Convert HSV (0-1) to an (r, g, b) tuple of 0-255 ints.
+
+    Memoized: LED animations step through the same hues every cycle.
+    """
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
 def honor_sleep():
     """Block the calling (app) thread while the emulated device is asleep.
 
@@ -34,6 +52,35 @@ def honor_sleep():
         _time.sleep(0.05)
 
 
+def square_wave(freq: float, duty: float = 0.5) -> array:
+    """Return one period of a signed 16-bit square wave.
+
+    Callers loop it (``Sound.play(loops=-1)``) rather than rendering a
+    full second, so construction is O(period) instead of O(SAMPLE_RATE).
+    """
+    period = SAMPLE_RATE / freq if freq > 0 else 1
+    return array("h", [TONE_AMPLITUDE if i / period < duty else -TONE_AMPLITUDE
+                       for i in range(max(1, int(period)))])
+
+
+# (freq, duty) -> pygame Sound, shared by every buzzer; least recently used first
+_tone_cache: dict = {}
+_TONE_CACHE_SIZE = 64
+
+
+def tone_sound(freq: float, duty: float = 0.5):
+    """Return a looping-ready pygame Sound for a square wave tone."""
+    key = (freq, duty)
+    sound = _tone_cache.pop(key, None)
+    if sound is None:
+        import pygame
+        sound = pygame.mixer.Sound(buffer=square_wave(freq, duty))
+        if len(_tone_cache) >= _TONE_CACHE_SIZE:
+            del _tone_cache[next(iter(_tone_cache))]
+    _tone_cache[key] = sound
+    return sound
+
+
 class MockDevice:
     """Base class for mock devices with tracing support."""
 
@@ -3,7 +3,7 @@
 The blinky module provides the display driver for the 39x26 LED matrix display.
 """
 
-from emulator import get_state
+from emulator import advance_frame, get_state
 
 # Display dimensions (39x26 = 1014 LED positions, 872 actual LEDs)
 WIDTH = 39
@@ -76,10 +76,10 @@ class Blinky:
             display.render(buffer_2d)
 
         # Track frame count in emulator state
-        state["frame_count"] = state.get("frame_count", 0) + 1
+        frame = advance_frame()
 
         if state.get("trace"):
-            print(f"[blinky] Display updated, frame {state['frame_count']}")
+            print(f"[blinky] Display updated, frame {frame}")
 
     def clear(self):
         """Clear the display buffer."""
@@ -1,6 +1,6 @@
 """Mock implementation of RGB encoder wheel breakout."""
 
-from emulator.mocks.base import I2CSensorMock
+from emulator.mocks.base import I2CSensorMock, hsv_to_rgb8
 
 NUM_LEDS = 24
 NUM_BUTTONS = 5
@@ -44,9 +44,7 @@ class BreakoutEncoderWheel(I2CSensorMock):
             self._leds[index] = (r, g, b)
 
     def set_hsv(self, index, h, s=1.0, v=1.0):
-        import colorsys
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        self.set_rgb(index, int(r * 255), int(g * 255), int(b * 255))
+        self.set_rgb(index, *hsv_to_rgb8(h, s, v))
 
     def clear(self):
         self._leds = [(0, 0, 0)] * NUM_LEDS
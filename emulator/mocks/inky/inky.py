@@ -2,7 +2,7 @@
 
 from typing import Any, List, Tuple
 
-from emulator import get_display, get_state
+from emulator import advance_frame, get_display, get_state
 
 # Try to import PIL for image handling
 try:
@@ -217,7 +217,7 @@ class Inky:
         if display:
             display.render(rgb_buffer)
 
-        state["frame_count"] = state.get("frame_count", 0) + 1
+        advance_frame()
 
     def get_buffer(self) -> List[List[int]]:
         """Get raw buffer (for testing/emulator use)."""
@@ -5,7 +5,7 @@ This is the core display API used by all Pimoroni devices.
 
 from typing import List, Optional, Tuple
 
-from emulator import get_display, get_state
+from emulator import advance_frame, get_display, get_state
 from emulator.mocks.fonts import BitmapFont, get_font
 
 # Display types
@@ -189,8 +189,35 @@ class PicoGraphics:
 
     def pixel_span(self, x: int, y: int, length: int):
         """Draw a horizontal span of pixels."""
-        for i in range(length):
-            self.pixel(x + i, y)
+        x0, y0, x1, y1 = self._clip
+        if not y0 <= y < y1:
+            return
+        start = max(x, x0)
+        end = min(x + length, x1)
+        if start < end:
+            # Slice assignment fills the whole run in one C-level copy
+            self._buffer[y][start:end] = [self._current_pen] * (end - start)
+
+    def _blit_row(self, x: int, y: int, pens: List[Optional[int]]):
+        """Copy a row of pens to (x, y), skipping ``None`` (transparent) entries.
+
+        Emulator helper for bulk image decoders; clipped like ``pixel``.
+        """
+        x0, y0, x1, y1 = self._clip
+        if not y0 <= y < y1:
+            return
+        start = max(x, x0)
+        end = min(x + len(pens), x1)
+        if start >= end:
+            return
+        segment = pens[start - x:end - x]
+        row = self._buffer[y]
+        if None not in segment:
+            row[start:end] = segment
+        else:
+            for i, pen in enumerate(segment, start):
+                if pen is not None:
+                    row[i] = pen
 
     def line(self, x1: int, y1: int, x2: int, y2: int, thickness: int = None):
         """Draw a line."""
@@ -385,7 +412,7 @@ class PicoGraphics:
         if display:
             display.render(self._buffer)
 
-        state["frame_count"] = state.get("frame_count", 0) + 1
+        advance_frame()
 
     def partial_update(self, x: int, y: int, w: int, h: int):
         """Partial display update (for e-ink)."""
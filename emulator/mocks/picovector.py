@@ -8,7 +8,9 @@ import math
 import os
 import struct
 import sys
-from typing import List, Optional, Tuple
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
 
 from emulator import get_state
 
@@ -24,6 +26,20 @@ ANTIALIAS_NONE = 0
 ANTIALIAS_FAST = 1  # 4x
 ANTIALIAS_BEST = 2  # 16x
 
+# (cos, sin) at each step of a quarter turn, shared by rounded-rect corners
+_CORNER_SEGMENTS = 8
+_QUARTER_ARC = tuple(
+    (math.cos(math.pi / 2 * i / _CORNER_SEGMENTS), math.sin(math.pi / 2 * i / _CORNER_SEGMENTS))
+    for i in range(_CORNER_SEGMENTS + 1)
+)
+
+# 3x3 identity, row-major
+_IDENTITY = (
+    1.0, 0.0, 0.0,
+    0.0, 1.0, 0.0,
+    0.0, 0.0, 1.0
+)
+
 
 class Transform:
     """Transformation matrix for scaling, rotating, and translating shapes."""
@@ -33,12 +49,8 @@ class Transform:
 
     def reset(self):
         """Reset to identity transform."""
-        # 3x3 identity matrix stored as flat list
-        self._matrix = [
-            1.0, 0.0, 0.0,
-            0.0, 1.0, 0.0,
-            0.0, 0.0, 1.0
-        ]
+        # 3x3 identity matrix stored as a flat, contiguous array of doubles
+        self._matrix = array("d", _IDENTITY)
 
     def rotate(self, angle: float, center: Tuple[float, float] = (0, 0)):
         """Rotate by angle degrees around center point."""
@@ -49,11 +61,11 @@ class Transform:
 
         # Translate to origin, rotate, translate back
         self.translate(-cx, -cy)
-        rotation = [
+        rotation = (
             cos_a, -sin_a, 0.0,
             sin_a, cos_a, 0.0,
             0.0, 0.0, 1.0
-        ]
+        )
         self._multiply(rotation)
         self.translate(cx, cy)
 
@@ -61,20 +73,20 @@ class Transform:
         """Apply scaling."""
         if scale_y is None:
             scale_y = scale_x
-        scale_matrix = [
+        scale_matrix = (
             scale_x, 0.0, 0.0,
             0.0, scale_y, 0.0,
             0.0, 0.0, 1.0
-        ]
+        )
         self._multiply(scale_matrix)
 
     def translate(self, x: float, y: float):
         """Apply translation."""
-        trans_matrix = [
+        trans_matrix = (
             1.0, 0.0, x,
             0.0, 1.0, y,
             0.0, 0.0, 1.0
-        ]
+        )
         self._multiply(trans_matrix)
 
     def matrix(self, values: List[float]):
@@ -82,18 +94,15 @@ class Transform:
         if len(values) == 9:
             self._multiply(values)
 
-    def _multiply(self, other: List[float]):
+    def _multiply(self, other: Sequence[float]):
         """Multiply current matrix by another."""
-        a = self._matrix
-        b = other
-        result = [0.0] * 9
-
-        for i in range(3):
-            for j in range(3):
-                for k in range(3):
-                    result[i * 3 + j] += a[i * 3 + k] * b[k * 3 + j]
-
-        self._matrix = result
+        a0, a1, a2, a3, a4, a5, a6, a7, a8 = self._matrix
+        b0, b1, b2, b3, b4, b5, b6, b7, b8 = other
+        self._matrix = array("d", (
+            a0 * b0 + a1 * b3 + a2 * b6, a0 * b1 + a1 * b4 + a2 * b7, a0 * b2 + a1 * b5 + a2 * b8,
+            a3 * b0 + a4 * b3 + a5 * b6, a3 * b1 + a4 * b4 + a5 * b7, a3 * b2 + a4 * b5 + a5 * b8,
+            a6 * b0 + a7 * b3 + a8 * b6, a6 * b1 + a7 * b4 + a8 * b7, a6 * b2 + a7 * b5 + a8 * b8,
+        ))
 
     def apply(self, x: float, y: float) -> Tuple[float, float]:
         """Apply transform to a point."""
@@ -109,6 +118,18 @@ class Polygon:
     def __init__(self):
         self._paths: List[List[Tuple[float, float]]] = []
         self._stroke = 0
+        # True while every path is convex (one span per scanline), which
+        # lets PicoVector.draw() use the edge-walking fill.
+        self._convex = True
+        # Per-path bounding boxes, filled in lazily as paths are appended
+        self._bounds: List[Optional[Tuple[float, float, float, float]]] = []
+
+    def _get_path_bounds(self) -> List[Optional[Tuple[float, float, float, float]]]:
+        """Return the bounding box of each path, computing any new ones."""
+        bounds = self._bounds
+        for path in self._paths[len(bounds):]:
+            bounds.append(_path_bounds(path))
+        return bounds
 
     @classmethod
     def from_svg(cls, filename: str) -> "Polygon":
@@ -123,6 +144,7 @@ class Polygon:
         paths = _load_svg(resolved)
         poly = cls()
         poly._paths = paths
+        poly._convex = False
 
         state = get_state()
         if state.get("trace"):
@@ -134,6 +156,8 @@ class Polygon:
         """Add a path from a list of points."""
         if len(points) >= 3:
             self._paths.append(list(points))
+            if not _is_convex(points):
+                self._convex = False
         return self
 
     def line(self, x1: float, y1: float, x2: float, y2: float, thickness: float = 1):
@@ -165,18 +189,20 @@ class Polygon:
 
         if all(c == 0 for c in corners):
             # Simple rectangle
-            if stroke > 0:
-                # Stroke: outer and inner rectangles
-                self._paths.append([
-                    (x, y), (x + w, y), (x + w, y + h), (x, y + h)
-                ])
-                self._paths.append([
-                    (x + stroke, y + stroke),
-                    (x + w - stroke, y + stroke),
-                    (x + w - stroke, y + h - stroke),
-                    (x + stroke, y + h - stroke)
-                ])
+            if 0 < stroke and 2 * stroke < min(w, h):
+                # Stroke: four thin sides (top, bottom, left, right)
+                inner_h = h - 2 * stroke
+                for sx, sy, sw, sh in (
+                    (x, y, w, stroke),
+                    (x, y + h - stroke, w, stroke),
+                    (x, y + stroke, stroke, inner_h),
+                    (x + w - stroke, y + stroke, stroke, inner_h),
+                ):
+                    self._paths.append([
+                        (sx, sy), (sx + sw, sy), (sx + sw, sy + sh), (sx, sy + sh)
+                    ])
             else:
+                # Unstroked, or a stroke thick enough to cover the whole box
                 self._paths.append([
                     (x, y), (x + w, y), (x + w, y + h), (x, y + h)
                 ])
@@ -191,36 +217,33 @@ class Polygon:
         """Generate points for a rounded rectangle."""
         r1, r2, r3, r4 = corners  # top-left, top-right, bottom-right, bottom-left
         points = []
-        segments = 8  # segments per corner
 
+        # Each corner sweeps a quarter turn; (cos, sin) of the sweep comes
+        # from the shared LUT, rotated into place by swapping/negating.
         # Top edge (left to right)
         if r1 > 0:
-            for i in range(segments + 1):
-                angle = math.pi + (math.pi / 2) * (i / segments)
-                points.append((x + r1 + r1 * math.cos(angle), y + r1 + r1 * math.sin(angle)))
+            cx, cy = x + r1, y + r1
+            points.extend((cx - r1 * c, cy - r1 * s) for c, s in _QUARTER_ARC)
         else:
             points.append((x, y))
 
         if r2 > 0:
-            for i in range(segments + 1):
-                angle = -math.pi / 2 + (math.pi / 2) * (i / segments)
-                points.append((x + w - r2 + r2 * math.cos(angle), y + r2 + r2 * math.sin(angle)))
+            cx, cy = x + w - r2, y + r2
+            points.extend((cx + r2 * s, cy - r2 * c) for c, s in _QUARTER_ARC)
         else:
             points.append((x + w, y))
 
         # Right edge, bottom-right corner
         if r3 > 0:
-            for i in range(segments + 1):
-                angle = 0 + (math.pi / 2) * (i / segments)
-                points.append((x + w - r3 + r3 * math.cos(angle), y + h - r3 + r3 * math.sin(angle)))
+            cx, cy = x + w - r3, y + h - r3
+            points.extend((cx + r3 * c, cy + r3 * s) for c, s in _QUARTER_ARC)
         else:
             points.append((x + w, y + h))
 
         # Bottom edge, bottom-left corner
         if r4 > 0:
-            for i in range(segments + 1):
-                angle = math.pi / 2 + (math.pi / 2) * (i / segments)
-                points.append((x + r4 + r4 * math.cos(angle), y + h - r4 + r4 * math.sin(angle)))
+            cx, cy = x + r4, y + h - r4
+            points.extend((cx - r4 * s, cy + r4 * c) for c, s in _QUARTER_ARC)
         else:
             points.append((x, y + h))
 
@@ -290,6 +313,7 @@ class Polygon:
             points.append((x, y))
 
         self._paths.append(points)
+        self._convex = False
         return self
 
     def star(self, x: float, y: float, num_points: int,
@@ -309,9 +333,38 @@ class Polygon:
             points.append((px, py))
 
         self._paths.append(points)
+        self._convex = False
         return self
 
 
+def _sample_bezier(seg, steps: int) -> List[Tuple[float, float]]:
+    """Evaluate a cubic or quadratic Bezier at t = 1/steps .. 1.
+
+    Works on plain floats pulled from the control points once, rather than
+    going through svgelements' per-call Point machinery.
+    """
+    x0, y0 = float(seg.start.x), float(seg.start.y)
+    x3, y3 = float(seg.end.x), float(seg.end.y)
+    points = []
+    if type(seg).__name__ == "CubicBezier":
+        x1, y1 = float(seg.control1.x), float(seg.control1.y)
+        x2, y2 = float(seg.control2.x), float(seg.control2.y)
+        for i in range(1, steps + 1):
+            t = i / steps
+            mt = 1.0 - t
+            a, b, c, d = mt * mt * mt, 3.0 * mt * mt * t, 3.0 * mt * t * t, t * t * t
+            points.append((a * x0 + b * x1 + c * x2 + d * x3,
+                           a * y0 + b * y1 + c * y2 + d * y3))
+    else:
+        x1, y1 = float(seg.control.x), float(seg.control.y)
+        for i in range(1, steps + 1):
+            t = i / steps
+            mt = 1.0 - t
+            a, b, c = mt * mt, 2.0 * mt * t, t * t
+            points.append((a * x0 + b * x1 + c * x3, a * y0 + b * y1 + c * y3))
+    return points
+
+
 def _linearize_path(path, tolerance: float = 1.0) -> List[List[Tuple[float, float]]]:
     """Convert an svgelements Path into lists of (x, y) points.
 
@@ -345,10 +398,12 @@ def _linearize_path(path, tolerance: float = 1.0) -> List[List[Tuple[float, floa
             except (ZeroDivisionError, ValueError):
                 length = 10.0
             steps = max(4, int(length / tolerance))
-            for i in range(1, steps + 1):
-                t = i / steps
-                pt = seg.point(t)
-                current.append((float(pt.real), float(pt.imag)))
+            if seg_type == "Arc":
+                for i in range(1, steps + 1):
+                    pt = seg.point(i / steps)
+                    current.append((float(pt.real), float(pt.imag)))
+            else:
+                current.extend(_sample_bezier(seg, steps))
 
         else:
             # Unknown segment type – try to grab the endpoint
@@ -361,11 +416,18 @@ def _linearize_path(path, tolerance: float = 1.0) -> List[List[Tuple[float, floa
     return subpaths
 
 
+# Linearised SVG paths keyed by (absolute path, mtime_ns), most recent last
+_svg_cache: "OrderedDict[Tuple[str, int], Tuple[List[Tuple[float, float]], ...]]" = OrderedDict()
+_SVG_CACHE_SIZE = 32
+
+
 def _load_svg(filepath: str) -> List[List[Tuple[float, float]]]:
     """Parse an SVG file and return polygon paths.
 
     Uses svgelements to parse shapes, paths, transforms, and viewBox.
     All curves are linearised into point lists suitable for scanline fill.
+    Results are cached until the file's mtime changes; callers get a fresh
+    outer list but share the (never mutated) per-path point lists.
     """
     if not _HAS_SVG:
         raise ImportError(
@@ -373,6 +435,22 @@ def _load_svg(filepath: str) -> List[List[Tuple[float, float]]]:
             "Install it with: pip install svgelements"
         )
 
+    filepath = os.path.abspath(filepath)
+    key = (filepath, os.stat(filepath).st_mtime_ns)
+    cached = _svg_cache.get(key)
+    if cached is not None:
+        _svg_cache.move_to_end(key)
+        return list(cached)
+
+    all_paths = _parse_svg(filepath)
+    _svg_cache[key] = tuple(all_paths)
+    if len(_svg_cache) > _SVG_CACHE_SIZE:
+        _svg_cache.popitem(last=False)
+    return all_paths
+
+
+def _parse_svg(filepath: str) -> List[List[Tuple[float, float]]]:
+    """Parse and linearise every shape in an SVG file (uncached)."""
     svg = svgelements.SVG.parse(filepath)
     all_paths: List[List[Tuple[float, float]]] = []
 
@@ -393,6 +471,172 @@ def _load_svg(filepath: str) -> List[List[Tuple[float, float]]]:
     return all_paths
 
 
+# Clip extent used when rasterising glyphs off-display into the span cache
+_NO_CLIP = 1 << 30
+
+# Unrotated glyphs are placed on a 1/_GLYPH_PHASES pixel grid, so text at
+# arbitrary (e.g. animated) positions reuses a few cached rasterisations
+_GLYPH_PHASES = 4
+
+
+def _scanline_spans(points: List[Tuple[int, int]],
+                    clip: Tuple[int, int, int, int]) -> List[Tuple[int, int, int]]:
+    """Scanline-fill a polygon into (y, x_start, x_end) spans within clip."""
+    if len(points) < 3:
+        return []
+
+    # Find bounding box, clipped to the inclusive (x0, y0, x1, y1) box
+    min_y = max(clip[1], min(p[1] for p in points))
+    max_y = min(clip[3], max(p[1] for p in points))
+    min_x = max(clip[0], min(p[0] for p in points))
+    max_x = min(clip[2], max(p[0] for p in points))
+
+    spans = []
+    n = len(points)
+    for y in range(min_y, max_y + 1):
+        intersections = []
+
+        for i in range(n):
+            x1, y1 = points[i]
+            x2, y2 = points[(i + 1) % n]
+
+            if y1 == y2:
+                continue
+
+            if min(y1, y2) <= y < max(y1, y2):
+                # Calculate intersection
+                x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+                intersections.append(int(x))
+
+        intersections.sort()
+
+        # Fill between pairs of intersections
+        for i in range(0, len(intersections) - 1, 2):
+            x_start = max(min_x, intersections[i])
+            x_end = min(max_x, intersections[i + 1])
+            if x_start <= x_end:
+                spans.append((y, x_start, x_end))
+    return spans
+
+
+def _convex_spans(points: List[Tuple[int, int]],
+                  clip: Tuple[int, int, int, int]) -> List[Tuple[int, int, int]]:
+    """Fill a y-monotone (convex) polygon with one span per scanline.
+
+    Walks the two edge chains running from the topmost vertex to the
+    bottom one, so there is no per-scanline edge scan or sort. Produces
+    exactly the same spans as ``_scanline_spans`` for convex input.
+    """
+    n = len(points)
+    if n < 3:
+        return []
+
+    top = 0
+    min_y = max_y = points[0][1]
+    min_x = max_x = points[0][0]
+    for i in range(1, n):
+        px, py = points[i]
+        if py < min_y:
+            min_y = py
+            top = i
+        elif py > max_y:
+            max_y = py
+        if px < min_x:
+            min_x = px
+        elif px > max_x:
+            max_x = px
+
+    y = max(clip[1], min_y)
+    # The bottom vertex row itself has no active edges, so stop before it
+    y_end = min(clip[3] + 1, max_y)
+    min_x = max(clip[0], min_x)
+    max_x = min(clip[2], max_x)
+
+    # The left-hand chain steps forward through the points and the
+    # right-hand one backward; each active edge covers y1 <= y < y2.
+    spans = []
+    li, ri = top, top
+    while y < y_end:
+        # Advance both chains past edges that end at or above y
+        while True:
+            x1, y1 = points[li]
+            x2, y2 = points[(li + 1) % n]
+            if y < y2:
+                break
+            li = (li + 1) % n
+            if li == top:
+                return spans
+        while True:
+            x3, y3 = points[ri]
+            x4, y4 = points[(ri - 1) % n]
+            if y < y4:
+                break
+            ri = (ri - 1) % n
+            if ri == top:
+                return spans
+
+        xa = int(x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+        xb = int(x3 + (y - y3) * (x4 - x3) / (y4 - y3))
+        if xa > xb:
+            xa, xb = xb, xa
+        x_start = max(min_x, xa)
+        x_end = min(max_x, xb)
+        if x_start <= x_end:
+            spans.append((y, x_start, x_end))
+        y += 1
+    return spans
+
+
+def _path_bounds(points) -> Optional[Tuple[float, float, float, float]]:
+    """Return (min_x, min_y, max_x, max_y) of points, or None if empty."""
+    if not points:
+        return None
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _is_convex(points: List[Tuple[float, float]]) -> bool:
+    """Return True if points form a simple convex polygon.
+
+    Every turn must go the same way and the outline may only reverse
+    vertical direction twice (once at the top, once at the bottom), which
+    rules out self-intersecting outlines like a pentagram. Such polygons
+    stay y-monotone under any affine transform.
+    """
+    n = len(points)
+    if n < 3:
+        return False
+
+    turn = 0
+    flips = 0
+    last_dy = 0
+    for i in range(n):
+        x0, y0 = points[i - 1]
+        x1, y1 = points[i]
+        x2, y2 = points[(i + 1) % n]
+        cross = (x1 - x0) * (y2 - y1) - (y1 - y0) * (x2 - x1)
+        if cross:
+            if turn and (cross > 0) != (turn > 0):
+                return False
+            turn = cross
+        dy = y2 - y1
+        if dy:
+            if last_dy and (dy > 0) != (last_dy > 0):
+                flips += 1
+            last_dy = dy
+
+    # Count the wrap-around between the last and first vertical moves
+    for i in range(n):
+        dy = points[(i + 1) % n][1] - points[i][1]
+        if dy:
+            if (dy > 0) != (last_dy > 0):
+                flips += 1
+            break
+
+    return turn != 0 and flips <= 2
+
+
 def _resolve_file(filename: str) -> Optional[str]:
     """Resolve a filename relative to app dir, cwd, or sys.path."""
     search_paths = []
@@ -442,7 +686,7 @@ def _load_af_font(filepath: str) -> Optional[dict]:
         cp, gx, gy, gw, gh, advance, pc = struct.unpack_from(">HbbBBBB", data, offset)
         glyphs.append({
             "codepoint": cp, "x": gx, "y": gy, "w": gw, "h": gh,
-            "advance": advance, "path_count": pc, "paths": [],
+            "advance": advance, "path_count": pc, "paths": [], "convex": [],
         })
         offset += 8
 
@@ -482,10 +726,12 @@ def _load_af_font(filepath: str) -> Optional[dict]:
             pts = all_points[point_idx:point_idx + n_pts]
             point_idx += n_pts
             glyph["paths"].append(pts)
+            glyph["convex"].append(_is_convex(pts))
 
     # Build lookup dict
     font = {}
     for g in glyphs:
+        g["bounds"] = _path_bounds([p for path in g["paths"] for p in path])
         font[g["codepoint"]] = g
     return font
 
@@ -508,6 +754,10 @@ class PicoVector:
         self._font_line_height = 110  # percentage
         self._font_align = 0  # 0=left, 1=center, 2=right
 
+        # Rasterised glyph spans keyed by (codepoint, scale, sub-pixel offset)
+        self._glyph_cache: OrderedDict = OrderedDict()
+        self._glyph_cache_size = 512
+
         state = get_state()
         if state.get("trace"):
             print("[PicoVector] Initialized")
@@ -525,8 +775,8 @@ class PicoVector:
         if not polygon._paths:
             return
 
-        for path in polygon._paths:
-            if len(path) < 3:
+        for path, bounds in zip(polygon._paths, polygon._get_path_bounds()):
+            if len(path) < 3 or self._offscreen(self._transform._matrix, bounds):
                 continue
 
             # Apply transform to all points
@@ -536,51 +786,85 @@ class PicoVector:
             int_points = [(int(x), int(y)) for x, y in transformed]
 
             # Draw filled polygon using PicoGraphics
-            self._fill_polygon(int_points)
-
-    def _fill_polygon(self, points: List[Tuple[int, int]]):
-        """Fill a polygon using scanline algorithm."""
-        if len(points) < 3:
-            return
+            if polygon._convex:
+                self._fill_convex_polygon(int_points)
+            else:
+                self._fill_polygon(int_points)
 
-        # Find bounding box
-        min_y = min(p[1] for p in points)
-        max_y = max(p[1] for p in points)
-        min_x = min(p[0] for p in points)
-        max_x = max(p[0] for p in points)
+    def _offscreen(self, m: List[float], bounds) -> bool:
+        """Return True if the box bounds, transformed by m, misses the display.
 
-        # Clip to display bounds
+        Only the four corners are transformed, which still gives a
+        conservative box under rotation.
+        """
+        if bounds is None:
+            return True
+        x0, y0, x1, y1 = bounds
+        xs = [m[0] * x + m[1] * y + m[2] for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1))]
+        ys = [m[3] * x + m[4] * y + m[5] for x, y in ((x0, y0), (x1, y0), (x1, y1), (x0, y1))]
         width, height = self._display.get_bounds()
-        min_y = max(0, min_y)
-        max_y = min(height - 1, max_y)
-        min_x = max(0, min_x)
-        max_x = min(width - 1, max_x)
+        # Shapes truncate their coordinates and text floors them; either
+        # way, nothing at or below -1 can land on row/column 0
+        return max(xs) <= -1 or max(ys) <= -1 or min(xs) >= width or min(ys) >= height
 
-        # Scanline fill
-        n = len(points)
-        for y in range(min_y, max_y + 1):
-            intersections = []
-
-            for i in range(n):
-                x1, y1 = points[i]
-                x2, y2 = points[(i + 1) % n]
+    def _fill_polygon(self, points: List[Tuple[int, int]]):
+        """Fill a polygon using scanline algorithm."""
+        self._fill_spans(_scanline_spans(points, self._clip_box()))
 
-                if y1 == y2:
-                    continue
+    def _fill_convex_polygon(self, points: List[Tuple[int, int]]):
+        """Fill a convex polygon with one span per scanline."""
+        self._fill_spans(_convex_spans(points, self._clip_box()))
 
-                if min(y1, y2) <= y < max(y1, y2):
-                    # Calculate intersection
-                    x = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
-                    intersections.append(int(x))
+    def _clip_box(self) -> Tuple[int, int, int, int]:
+        """Return the display bounds as an inclusive (x0, y0, x1, y1) box."""
+        width, height = self._display.get_bounds()
+        return (0, 0, width - 1, height - 1)
 
-            intersections.sort()
+    def _fill_spans(self, spans, dx: int = 0, dy: int = 0):
+        """Draw (y, x_start, x_end) spans, offset by (dx, dy) and clipped."""
+        width, height = self._display.get_bounds()
+        pixel_span = self._display.pixel_span
+        for y, x_start, x_end in spans:
+            y += dy
+            if not 0 <= y < height:
+                continue
+            x_start = max(0, x_start + dx)
+            x_end = min(width - 1, x_end + dx)
+            if x_start <= x_end:
+                pixel_span(x_start, y, x_end - x_start + 1)
+
+    def _glyph_spans(self, glyph: dict, m: List[float]) -> Tuple[Tuple[int, int, int], ...]:
+        """Return a glyph's spans rasterised at the sub-pixel part of m's offset.
+
+        m must be a scale+translate matrix. Spans are relative to the
+        integer part of the offset, so the same glyph drawn at the same
+        size and sub-pixel phase reuses one rasterisation. text() snaps
+        the offset to _GLYPH_PHASES steps, bounding the phases per glyph.
+        """
+        tx, ty = m[2], m[5]
+        fx, fy = tx - math.floor(tx), ty - math.floor(ty)
+        key = (glyph["codepoint"], m[0], m[4], fx, fy)
+        cache = self._glyph_cache
+        spans = cache.get(key)
+        if spans is not None:
+            cache.move_to_end(key)
+            return spans
+
+        sx, sy = m[0], m[4]
+        unclipped = (-_NO_CLIP, -_NO_CLIP, _NO_CLIP, _NO_CLIP)
+        rows = []
+        for path_points, convex in zip(glyph["paths"], glyph["convex"]):
+            if len(path_points) < 3:
+                continue
+            int_points = [(math.floor(px * sx + fx), math.floor(py * sy + fy)) for px, py in path_points]
+            fill = _convex_spans if convex else _scanline_spans
+            rows.extend(fill(int_points, unclipped))
 
-            # Fill between pairs of intersections
-            for i in range(0, len(intersections) - 1, 2):
-                x_start = max(min_x, intersections[i])
-                x_end = min(max_x, intersections[i + 1])
-                for x in range(x_start, x_end + 1):
-                    self._display.pixel(x, y)
+        spans = tuple(rows)
+        cache[key] = spans
+        if len(cache) > self._glyph_cache_size:
+            cache.popitem(last=False)
+        return spans
 
     # Font methods
     def set_font(self, filename: str, size: float = None):
@@ -591,6 +875,7 @@ class PicoVector:
 
         # Try to load .af font file
         self._af_font = None
+        self._glyph_cache.clear()
         if filename.endswith(".af"):
             resolved = _resolve_file(filename)
             if resolved is not None:
@@ -712,7 +997,7 @@ class PicoVector:
                 # Build caret transform matching upstream:
                 # caret_transform = text_transform * scale(s,s) * translate(cx, cy + align_offset)
                 caret = Transform()
-                caret._matrix = list(text_transform._matrix)
+                caret._matrix = text_transform._matrix[:]
                 caret.scale(scale, scale)
                 caret.translate(caret_x, caret_y)
 
@@ -724,16 +1009,32 @@ class PicoVector:
 
                 # Compose with the global set_transform
                 final = Transform()
-                final._matrix = list(self._transform._matrix)
+                final._matrix = self._transform._matrix[:]
                 final._multiply(caret._matrix)
 
-                # Render each path in the glyph
-                for path_points in glyph["paths"]:
-                    if len(path_points) < 3:
-                        continue
-                    transformed = [final.apply(px, py) for px, py in path_points]
-                    int_points = [(int(px), int(py)) for px, py in transformed]
-                    self._fill_polygon(int_points)
+                m = final._matrix
+                if m[1] == 0 and m[3] == 0:
+                    m[2] = round(m[2] * _GLYPH_PHASES) / _GLYPH_PHASES
+                    m[5] = round(m[5] * _GLYPH_PHASES) / _GLYPH_PHASES
+                if self._offscreen(m, glyph["bounds"]):
+                    pass  # Nothing of this glyph lands on the display
+                elif m[1] == 0 and m[3] == 0 and self._glyph_cache_size:
+                    # Unrotated glyphs are stamped from the span cache
+                    spans = self._glyph_spans(glyph, m)
+                    self._fill_spans(spans, math.floor(m[2]), math.floor(m[5]))
+                else:
+                    # Render each path in the glyph
+                    for path_points, convex in zip(glyph["paths"], glyph["convex"]):
+                        if len(path_points) < 3:
+                            continue
+                        transformed = [final.apply(px, py) for px, py in path_points]
+                        # floor, not int(): the span cache above floors too,
+                        # and int() rounds negative coordinates the other way
+                        int_points = [(math.floor(px), math.floor(py)) for px, py in transformed]
+                        if convex:
+                            self._fill_convex_polygon(int_points)
+                        else:
+                            self._fill_polygon(int_points)
 
                 # Advance caret
                 if ch == ' ':
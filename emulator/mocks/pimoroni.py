@@ -3,22 +3,22 @@
 Contains hardware helpers like Button, RGBLED, Buzzer, etc.
 """
 
-import time as _time
-
-from emulator import get_state
+from emulator import get_state, trace_enabled
+from emulator.mocks.base import hsv_to_rgb8, tone_sound
 
 
 class Button:
-    """Hardware button with interrupt support."""
+    """Hardware button with interrupt support.
+
+    Emulated input has no contact bounce, so there is no time-based
+    debounce: repeated press or release events are simply ignored.
+    repeat_time and hold_time are accepted for API compatibility only.
+    """
 
     def __init__(self, pin: int, invert: bool = True, repeat_time: int = 200, hold_time: int = 1000):
         self._pin = pin
         self._invert = invert
-        self._repeat_time = repeat_time
-        self._hold_time = hold_time
         self._pressed = False
-        self._last_press = 0
-        self._press_start = 0
 
         # Register with emulator
         state = get_state()
@@ -41,15 +41,18 @@ class Button:
     # Methods called by emulator
     def _press(self):
         """Called when button is pressed."""
+        if self._pressed:
+            return
         self._pressed = True
-        self._press_start = _time.time()
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[Button] Pin {self._pin} pressed")
 
     def _release(self):
         """Called when button is released."""
+        if not self._pressed:
+            return
         self._pressed = False
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[Button] Pin {self._pin} released")
 
 
@@ -76,14 +79,12 @@ class RGBLED:
         self._r = max(0, min(255, r))
         self._g = max(0, min(255, g))
         self._b = max(0, min(255, b))
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[RGBLED] Set to ({r}, {g}, {b})")
 
     def set_hsv(self, h: float, s: float, v: float):
         """Set LED color from HSV (0-1 range)."""
-        import colorsys
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        self.set_rgb(int(r * 255), int(g * 255), int(b * 255))
+        self.set_rgb(*hsv_to_rgb8(h, s, v))
 
     def set_brightness(self, brightness: int):
         """Set overall brightness (0-255)."""
@@ -130,31 +131,24 @@ class Buzzer:
             return False
 
     def _generate_tone(self, freq: int, duty: float = 0.5):
-        """Generate a square wave tone as a pygame Sound."""
-        import array
-
-        import pygame
-        sample_rate = 44100
-        duration_samples = sample_rate  # 1 second looping buffer
-        buf = array.array('h')  # signed 16-bit
-        amplitude = 16000
-        period = sample_rate / freq if freq > 0 else 1
-        for i in range(duration_samples):
-            phase = (i % int(period)) / period if period > 0 else 0
-            val = amplitude if phase < duty else -amplitude
-            buf.append(int(val))
-        return pygame.mixer.Sound(buffer=buf)
+        """Return a square wave tone as a pygame Sound (one period, looped)."""
+        return tone_sound(freq, duty)
 
     def set_tone(self, frequency: int, duty: float = 0.5):
         """Set buzzer tone."""
+        unchanged = (frequency, duty) == (self._frequency, self._duty)
         self._frequency = frequency
         self._duty = duty
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[Buzzer] Tone {frequency}Hz, duty {duty}")
 
         if not self._ensure_audio():
             return
 
+        # The same tone is already looping; restarting it would only click
+        if unchanged and self._sound is not None and self._channel and self._channel.get_busy():
+            return
+
         if self._channel and self._channel.get_busy():
             self._channel.stop()
 
@@ -3,7 +3,75 @@
 Uses Pillow to decode PNG images and render them to PicoGraphics displays.
 """
 
-from emulator import get_state
+import sys
+from array import array
+
+from emulator import trace_enabled
+
+# Alpha byte -> 1 if the pixel is drawn, 0 if it is transparent
+_OPAQUE = bytes(int(a >= 128) for a in range(256))
+
+# Grey level -> RGB888 pen
+_GREY_PENS = [v * 0x010101 for v in range(256)]
+
+
+def _lut_pens(img):
+    """Return the 256-entry pen table for an "L" or "P" image.
+
+    Palette entries whose alpha is below 128 map to ``None``.
+    """
+    if img.mode == "L":
+        return _GREY_PENS
+    from PIL import Image
+
+    # Let Pillow resolve the palette and any tRNS chunk by converting a
+    # strip holding each index once.
+    img.load()
+    strip = Image.frombytes("P", (256, 1), bytes(range(256)))
+    strip.putpalette(img.palette.tobytes(), img.palette.mode)
+    if "transparency" in img.info:
+        strip.info["transparency"] = img.info["transparency"]
+    rgba = strip.convert("RGBA").tobytes()
+    return [(r << 16) | (g << 8) | b if a >= 128 else None
+            for r, g, b, a in zip(rgba[0::4], rgba[1::4], rgba[2::4], rgba[3::4])]
+
+
+def _pen_rows(img):
+    """Yield one list of RGB888 pens per image row.
+
+    Transparent pixels (alpha < 128) become ``None``. Greyscale and
+    palette images map their index bytes through a 256-entry table. For
+    RGB(A), Pillow packs the pens: the channels are merged into a 4-byte
+    layout whose native-endian ``uint32`` is ``(r << 16) | (g << 8) | b``.
+    """
+    w = img.width
+    if img.mode in ("L", "P"):
+        pen = _lut_pens(img).__getitem__
+        data = img.tobytes()
+        for off in range(0, len(data), w):
+            yield list(map(pen, data[off:off + w]))
+        return
+
+    from PIL import Image
+
+    r, g, b = img.getchannel("R"), img.getchannel("G"), img.getchannel("B")
+    zero = Image.new("L", img.size)
+    bands = (b, g, r, zero) if sys.byteorder == "little" else (zero, r, g, b)
+    pens = array("I")
+    pens.frombytes(Image.merge("RGBA", bands).tobytes())
+
+    if img.mode != "RGBA":
+        for off in range(0, len(pens), w):
+            yield pens[off:off + w].tolist()
+        return
+
+    opaque = img.getchannel("A").tobytes().translate(_OPAQUE)
+    for off in range(0, len(pens), w):
+        row = pens[off:off + w].tolist()
+        mask = opaque[off:off + w]
+        if 0 in mask:
+            row = [pen if keep else None for pen, keep in zip(row, mask)]
+        yield row
 
 
 class PNG:
@@ -20,6 +88,8 @@ class PNG:
         self._width = 0
         self._height = 0
         self._file_path = None
+        # (scale, rotate) -> (prepared PIL image, pen rows or None)
+        self._frames = {}
 
     def open_file(self, filename: str):
         """Open a PNG file for decoding.
@@ -35,12 +105,12 @@ class PNG:
 
             from emulator.mocks import _translate_path
             self._image = Image.open(_translate_path(filename))
+            self._frames = {}
             self._width = self._image.width
             self._height = self._image.height
             self._file_path = filename
 
-            state = get_state()
-            if state.get("trace"):
+            if trace_enabled():
                 print(f"[pngdec] Opened {filename} ({self._width}x{self._height})")
         except Exception as e:
             raise OSError(f"Failed to open PNG: {e}")
@@ -59,12 +129,12 @@ class PNG:
 
             from PIL import Image
             self._image = Image.open(io.BytesIO(data))
+            self._frames = {}
             self._width = self._image.width
             self._height = self._image.height
             self._file_path = None
 
-            state = get_state()
-            if state.get("trace"):
+            if trace_enabled():
                 print(f"[pngdec] Opened from RAM ({self._width}x{self._height})")
         except Exception as e:
             raise RuntimeError(f"Failed to decode PNG: {e}")
@@ -82,10 +152,30 @@ class PNG:
         if self._image is None:
             raise RuntimeError("No PNG file opened")
 
-        state = get_state()
-        if state.get("trace"):
+        if trace_enabled():
             print(f"[pngdec] decode at ({x}, {y}), scale={scale}")
 
+        # Converting, resizing and rotating is done once per (scale, rotate);
+        # repeat decodes (animation loops, icon grids) reuse the result.
+        key = (scale, rotate)
+        frame = self._frames.get(key)
+        if frame is None:
+            frame = self._frames[key] = [self._prepare(scale, rotate), None]
+        img = frame[0]
+
+        display_width, display_height = self._display.get_bounds()
+        if x >= display_width or y >= display_height or x + img.width <= 0 or y + img.height <= 0:
+            return  # Nothing lands on the display
+
+        if getattr(self._display, "_blit_row", None) is None or img.mode not in ("RGBA", "RGB", "L", "P"):
+            self._render_to_display(img, x, y)
+            return
+        if frame[1] is None:
+            frame[1] = list(_pen_rows(img))
+        self._blit_rows(frame[1], x, y)
+
+    def _prepare(self, scale: int, rotate: int):
+        """Return the opened image converted, scaled and rotated for decode()."""
         # Handle scaling
         if scale < 0:
             # Negative scale means divide dimensions
@@ -97,21 +187,25 @@ class PNG:
         width = int(self._width * scale_factor)
         height = int(self._height * scale_factor)
 
-        # Convert to RGB if necessary
+        # Resize with NEAREST, which keeps source pixels as-is. Downscaling
+        # happens before the mode conversion and upscaling after it, so the
+        # conversion always runs on the smaller image. (Image.reduce() would
+        # average pixels, and measures slower than NEAREST.)
+        from PIL import Image
         img = self._image
-        if img.mode == "P":
-            img = img.convert("RGBA")
-        elif img.mode not in ("RGB", "RGBA", "L"):
+        if scale_factor < 1:
+            img = img.resize((width, height), Image.Resampling.NEAREST)
+
+        # Convert to RGB if necessary. Palette images keep their indexes;
+        # the blit path looks them up in a 256-entry pen table.
+        if img.mode not in ("RGB", "RGBA", "L", "P"):
             img = img.convert("RGB")
 
-        # Resize if needed
-        if scale_factor != 1:
-            from PIL import Image
+        if scale_factor > 1:
             img = img.resize((width, height), Image.Resampling.NEAREST)
 
         # Handle rotation
         if rotate != 0:
-            from PIL import Image
             if rotate == 90:
                 img = img.transpose(Image.Transpose.ROTATE_90)
             elif rotate == 180:
@@ -119,39 +213,108 @@ class PNG:
             elif rotate == 270:
                 img = img.transpose(Image.Transpose.ROTATE_270)
 
-        # Render to display
-        self._render_to_display(img, x, y)
+        return img
 
-    def _render_to_display(self, img, x: int, y: int):
-        """Render a PIL image to the PicoGraphics display."""
-        display_width, display_height = self._display.get_bounds()
+    def _blit_rows(self, rows, x: int, y: int):
+        """Push cached pen rows to the display, skipping rows off-screen."""
+        blit_row = self._display._blit_row
+        _, display_height = self._display.get_bounds()
+        for row in range(max(0, -y), min(len(rows), display_height - y)):
+            blit_row(x, y + row, rows[row])
 
-        for py in range(img.height):
-            if y + py < 0 or y + py >= display_height:
-                continue
-            for px in range(img.width):
-                if x + px < 0 or x + px >= display_width:
-                    continue
+    def _render_to_display(self, img, x: int, y: int):
+        """Render a PIL image to the PicoGraphics display.
 
-                pixel = img.getpixel((px, py))
-
-                # Handle different image modes
-                if img.mode == "RGBA":
-                    r, g, b, a = pixel
-                    if a < 128:  # Skip transparent pixels
-                        continue
-                elif img.mode == "RGB":
-                    r, g, b = pixel
-                elif img.mode == "L":
-                    # Grayscale
-                    r = g = b = pixel
-                else:
+        Pixels are read from one ``tobytes()`` dump, and only the part of
+        the image that overlaps the display is visited. Each mode has its
+        own loop so the per-pixel work never branches on ``img.mode``.
+        """
+        if img.mode == "P":
+            # Only palettes with transparency need the alpha channel
+            has_alpha = "transparency" in img.info or img.palette.mode == "RGBA"
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        if img.mode == "RGBA":
+            self._render_rgba(img, x, y)
+        elif img.mode == "RGB":
+            self._render_rgb(img, x, y)
+        elif img.mode == "L":
+            self._render_l(img, x, y)
+
+    def _visible_rows(self, img, x: int, y: int, bpp: int):
+        """Yield ``(dy, dx_range, row_bytes)`` for the on-screen part of ``img``."""
+        display_width, display_height = self._display.get_bounds()
+        px_start = max(0, -x)
+        px_end = min(img.width, display_width - x)
+        py_range = range(max(0, -y), min(img.height, display_height - y))
+        if px_start >= px_end or not py_range:
+            return
+        data = memoryview(img.tobytes())
+        stride = img.width * bpp
+        dx_range = range(x + px_start, x + px_end)
+        for py in py_range:
+            off = py * stride
+            yield y + py, dx_range, data[off + px_start * bpp:off + px_end * bpp]
+
+    # The loops below reuse pens across the image (flat areas repeat
+    # colours) and only call set_pen when the pen actually changes.
+
+    def _render_rgba(self, img, x: int, y: int):
+        """Render an RGBA image, skipping pixels with alpha below 128."""
+        display = self._display
+        create_pen, set_pen, pixel = display.create_pen, display.set_pen, display.pixel
+        pens = {}
+        last_key = last_pen = None
+        for dy, dx_range, row in self._visible_rows(img, x, y, 4):
+            for dx, r, g, b, a in zip(dx_range, row[0::4], row[1::4], row[2::4], row[3::4]):
+                if a < 128:  # Skip transparent pixels
                     continue
-
-                # Create pen and draw pixel
-                pen = self._display.create_pen(r, g, b)
-                self._display.set_pen(pen)
-                self._display.pixel(x + px, y + py)
+                key = (r << 16) | (g << 8) | b
+                if key != last_key:
+                    last_key = key
+                    pen = pens.get(key)
+                    if pen is None:
+                        pen = pens[key] = create_pen(r, g, b)
+                    if pen != last_pen:
+                        set_pen(pen)
+                        last_pen = pen
+                pixel(dx, dy)
+
+    def _render_rgb(self, img, x: int, y: int):
+        """Render an RGB image."""
+        display = self._display
+        create_pen, set_pen, pixel = display.create_pen, display.set_pen, display.pixel
+        pens = {}
+        last_key = last_pen = None
+        for dy, dx_range, row in self._visible_rows(img, x, y, 3):
+            for dx, r, g, b in zip(dx_range, row[0::3], row[1::3], row[2::3]):
+                key = (r << 16) | (g << 8) | b
+                if key != last_key:
+                    last_key = key
+                    pen = pens.get(key)
+                    if pen is None:
+                        pen = pens[key] = create_pen(r, g, b)
+                    if pen != last_pen:
+                        set_pen(pen)
+                        last_pen = pen
+                pixel(dx, dy)
+
+    def _render_l(self, img, x: int, y: int):
+        """Render a greyscale image."""
+        display = self._display
+        create_pen, set_pen, pixel = display.create_pen, display.set_pen, display.pixel
+        pens = {}
+        last_key = last_pen = None
+        for dy, dx_range, row in self._visible_rows(img, x, y, 1):
+            for dx, v in zip(dx_range, row):
+                if v != last_key:
+                    last_key = v
+                    pen = pens.get(v)
+                    if pen is None:
+                        pen = pens[v] = create_pen(v, v, v)
+                    if pen != last_pen:
+                        set_pen(pen)
+                        last_pen = pen
+                pixel(dx, dy)
 
     def get_width(self) -> int:
         """Get image width."""
@@ -4,7 +4,7 @@ from collections import namedtuple
 from typing import Tuple
 
 from emulator import get_state
-from emulator.mocks.base import trace_log
+from emulator.mocks.base import hsv_to_rgb8, tone_sound, trace_log
 from emulator.mocks.picographics import (
     DISPLAY_PRESTO,
     DISPLAY_PRESTO_FULL_RES,
@@ -51,9 +51,9 @@ class Presto:
         )
         self.width, self.height = self.display.get_bounds()
 
-        # Create a raw framebuffer for direct access
-        # This is 480x480 RGB565 (2 bytes per pixel)
-        self._presto_buffer = bytearray(self.width * self.height * 2)
+        # Raw RGB565 framebuffer for direct access (2 bytes per pixel),
+        # allocated on first use: most apps only draw through PicoGraphics
+        self._presto_buffer = None
 
         # Register with emulator
         get_state()["presto"] = self
@@ -62,6 +62,8 @@ class Presto:
     @property
     def presto(self):
         """Get raw framebuffer for direct memory access."""
+        if self._presto_buffer is None:
+            self._presto_buffer = bytearray(self.width * self.height * 2)
         return self._presto_buffer
 
     @property
@@ -115,9 +117,7 @@ class Presto:
 
     def set_led_hsv(self, index: int, h: float, s: float, v: float):
         """Set individual LED color from HSV."""
-        import colorsys
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        self.set_led_rgb(index, int(r * 255), int(g * 255), int(b * 255))
+        self.set_led_rgb(index, *hsv_to_rgb8(h, s, v))
 
     def get_leds(self) -> list:
         """Get current LED colors (for emulator rendering)."""
@@ -170,24 +170,12 @@ class Buzzer:
             return False
 
     def _generate_tone(self, freq: int, duty: float = 0.5):
-        """Generate a square wave tone as a pygame Sound."""
-        import array
-
-        import pygame
-        sample_rate = 44100
-        duration_samples = sample_rate  # 1 second looping buffer
-        buf = array.array('h')  # signed 16-bit
-        amplitude = 16000
-        period = sample_rate / freq if freq > 0 else 1
-        for i in range(duration_samples):
-            # Square wave with variable duty cycle
-            phase = (i % int(period)) / period if period > 0 else 0
-            val = amplitude if phase < duty else -amplitude
-            buf.append(int(val))
-        return pygame.mixer.Sound(buffer=buf)
+        """Return a square wave tone as a pygame Sound (one period, looped)."""
+        return tone_sound(freq, duty)
 
     def set_tone(self, freq: int, duty: float = 0.5):
         """Set buzzer tone frequency and duty cycle."""
+        unchanged = (freq, duty) == (self._freq, self._duty)
         self._freq = freq
         self._duty = duty
         trace_log("Buzzer", f"set_tone({freq}, {duty})")
@@ -195,6 +183,10 @@ class Buzzer:
         if not self._ensure_audio():
             return
 
+        # The same tone is already looping; restarting it would only click
+        if unchanged and self._sound is not None and self._channel and self._channel.get_busy():
+            return
+
         # Stop current sound
         if self._channel and self._channel.get_busy():
             self._channel.stop()
@@ -1,12 +1,19 @@
 """Mock implementation of PSRAM (Pseudo-Static RAM) module."""
 
-from emulator import get_device, get_state
+import ctypes
+
+from emulator import get_device, trace_enabled
 
 # Default PSRAM size (8MB as per RP2350 devices)
 PSRAM_SIZE = 8 * 1024 * 1024
 
 _psram_used = 0
 
+# Freed buffers kept for reuse, keyed by size (allocate/free churn is
+# typical of decoder scratch space)
+_pool = {}
+_POOL_DEPTH = 4
+
 
 def available():
     """Check if PSRAM is available."""
@@ -26,18 +33,28 @@ def size():
 def allocate(nbytes):
     """Allocate memory from PSRAM."""
     global _psram_used
-    if get_state().get("trace"):
+    if trace_enabled():
         print(f"[PSRAM] Allocated {nbytes} bytes")
     _psram_used += nbytes
-    return bytearray(nbytes)
+    spare = _pool.get(nbytes)
+    if not spare:
+        return bytearray(nbytes)
+    buf = spare.pop()
+    # Recycled buffers must read back as zeros, like a fresh bytearray
+    ctypes.memset((ctypes.c_char * nbytes).from_buffer(buf), 0, nbytes)
+    return buf
 
 
 def free(buf):
     """Free PSRAM allocation."""
     global _psram_used
-    if get_state().get("trace"):
+    if trace_enabled():
         print(f"[PSRAM] Freed buffer ({len(buf)} bytes)")
     _psram_used = max(0, _psram_used - len(buf))
+    if isinstance(buf, bytearray) and len(buf):
+        spare = _pool.setdefault(len(buf), [])
+        if len(spare) < _POOL_DEPTH and not any(b is buf for b in spare):
+            spare.append(buf)
 
 
 def used():
@@ -1,8 +1,10 @@
 """Mock implementation of QwSTPad controller (I2C gamepad)."""
 
 from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 
-from emulator import get_state
+from emulator import get_state, trace_enabled
 from emulator.mocks.base import I2CSensorMock
 
 # I2C addresses (matching upstream: 0x21, 0x23, 0x25, 0x27)
@@ -12,6 +14,9 @@ ALT_ADDRESS_2 = 0x25
 ALT_ADDRESS_3 = 0x27
 ADDRESSES = (DEFAULT_ADDRESS, ALT_ADDRESS_1, ALT_ADDRESS_2, ALT_ADDRESS_3)
 
+# I2C address -> address_code() LED bitmask
+_ADDRESS_CODES = {address: 1 << i for i, address in enumerate(ADDRESSES)}
+
 NUM_LEDS = 4
 NUM_BUTTONS = 10
 
@@ -41,6 +46,16 @@ BUTTON_MAP = OrderedDict({
     "-": BUTTON_MINUS,
 })
 
+# Snapshot of BUTTON_MAP for building button states
+_BUTTON_ITEMS = tuple(BUTTON_MAP.items())
+
+
+@lru_cache(maxsize=1 << NUM_BUTTONS)
+def _button_state(bitmask):
+    """Return the read_buttons() mapping for a bitmask, as a shared read-only view."""
+    return MappingProxyType(OrderedDict([(name, bool(bitmask & mask)) for name, mask in _BUTTON_ITEMS]))
+
+
 # Keyboard key name → QwSTPad button bitmask
 KEY_TO_BUTTON = {
     "up": BUTTON_U,
@@ -85,8 +100,9 @@ class QwSTPad(I2CSensorMock):
         # Register with emulator state for input wiring and UI
         self._register("qwstpad")
 
-        # Initialize button state in emulator
-        state = get_state()
+        # Initialize button state in emulator. The state dict is a
+        # module-level singleton, so keep a reference for the hot readers.
+        state = self._state = get_state()
         if "qwstpad_buttons" not in state:
             state["qwstpad_buttons"] = 0
 
@@ -96,54 +112,59 @@ class QwSTPad(I2CSensorMock):
     def read_buttons(self):
         """Read current button state as OrderedDict (matching upstream API).
 
-        Returns an OrderedDict with button names as keys and bool values.
+        Returns a read-only view of an OrderedDict with button names as
+        keys and bool values, shared between calls; copy it to modify it.
         """
-        state = get_state()
-        bitmask = state.get("qwstpad_buttons", 0)
-        result = OrderedDict()
-        for name, mask in BUTTON_MAP.items():
-            result[name] = bool(bitmask & mask)
-        return result
+        return _button_state(self._state.get("qwstpad_buttons", 0))
+
+    @property
+    def buttons(self):
+        """All buttons as one bitmask of the BUTTON_* constants."""
+        return self._state.get("qwstpad_buttons", 0)
+
+    # The button_* properties test the live bitmask on each read. Input
+    # handlers write "qwstpad_buttons" straight into the shared state, so
+    # flags precomputed in _set_buttons would go stale.
 
     @property
     def button_a(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_A)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_A)
 
     @property
     def button_b(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_B)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_B)
 
     @property
     def button_x(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_X)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_X)
 
     @property
     def button_y(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_Y)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_Y)
 
     @property
     def button_plus(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_PLUS)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_PLUS)
 
     @property
     def button_minus(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_MINUS)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_MINUS)
 
     @property
     def button_u(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_U)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_U)
 
     @property
     def button_d(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_D)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_D)
 
     @property
     def button_l(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_L)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_L)
 
     @property
     def button_r(self):
-        return bool(get_state().get("qwstpad_buttons", 0) & BUTTON_R)
+        return bool(self._state.get("qwstpad_buttons", 0) & BUTTON_R)
 
     def set_led(self, led, state):
         """Set LED state (1-indexed, matching upstream)."""
@@ -153,12 +174,17 @@ class QwSTPad(I2CSensorMock):
             self._led_states |= (1 << (led - 1))
         else:
             self._led_states &= ~(1 << (led - 1))
-        self._trace(f"LED {led} = {state}")
+        if trace_enabled():
+            self._trace(f"LED {led} = {state}")
 
     def set_leds(self, states):
-        """Set all LEDs from a bitmask."""
+        """Set all LEDs from a bitmask (bit 0 is LED 1).
+
+        Prefer this over four set_led() calls when refreshing every LED.
+        """
         self._led_states = states & 0b1111
-        self._trace(f"set_leds(0b{self._led_states:04b})")
+        if trace_enabled():
+            self._trace(f"set_leds(0b{self._led_states:04b})")
 
     def clear_leds(self):
         """Clear all LEDs."""
@@ -167,12 +193,8 @@ class QwSTPad(I2CSensorMock):
 
     def address_code(self):
         """Get address code bitmask based on I2C address (matching upstream)."""
-        try:
-            idx = ADDRESSES.index(self._address)
-            return 1 << idx
-        except ValueError:
-            return 0
+        return _ADDRESS_CODES.get(self._address, 0)
 
     def _set_buttons(self, buttons):
         """Set mock button state for testing."""
-        get_state()["qwstpad_buttons"] = buttons
+        self._state["qwstpad_buttons"] = buttons
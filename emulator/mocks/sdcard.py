@@ -6,11 +6,17 @@ directory that simulates the SD card contents.
 
 from pathlib import Path
 
-from emulator import get_state
+from emulator import get_state, trace_enabled
 
 # Default SD card directory (can be overridden via emulator state)
 DEFAULT_SD_PATH = Path("/tmp/presto_sdcard")
 
+# Block-device ioctl op -> result (anything else returns 0)
+_IOCTL_RESULTS = {
+    4: 1024 * 1024,  # Sector count: fake 512MB card
+    5: 512,  # Sector size
+}
+
 
 class SDCard:
     """Mock SD card interface.
@@ -40,7 +46,7 @@ class SDCard:
         # Ensure the directory exists
         self._path.mkdir(parents=True, exist_ok=True)
 
-        if state.get("trace"):
+        if trace_enabled():
             print(f"[sdcard] Initialized, path={self._path}")
 
     def readblocks(self, block_num, buf):
@@ -53,11 +59,7 @@ class SDCard:
 
     def ioctl(self, op, arg):
         """I/O control operations."""
-        if op == 4:  # Get sector count
-            return 1024 * 1024  # Fake 512MB card
-        elif op == 5:  # Get sector size
-            return 512
-        return 0
+        return _IOCTL_RESULTS.get(op, 0)
 
     def get_path(self) -> Path:
         """Get the local filesystem path for this SD card."""
@@ -6,7 +6,7 @@ Uses real sockets so that network requests pass through to the host.
 import socket as _socket
 from typing import Optional, Tuple
 
-from emulator import get_state
+from emulator import trace_enabled
 
 # Constants
 AF_INET = _socket.AF_INET
@@ -34,13 +34,15 @@ class socket:
         self._blocking = True
         self._timeout = None
         self._real_socket = _socket.socket(af, socktype, proto)
+        # Bytes read ahead by readline() but not yet returned
+        self._rxbuf = bytearray()
 
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[socket] Created af={af} type={socktype}")
 
     def connect(self, address: Tuple[str, int]):
         """Connect to remote address."""
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[socket] Connect to {address}")
 
         if self._real_socket:
@@ -49,7 +51,7 @@ class socket:
 
     def bind(self, address: Tuple[str, int]):
         """Bind to local address."""
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[socket] Bind to {address}")
 
         if self._real_socket:
@@ -72,7 +74,7 @@ class socket:
 
     def send(self, data: bytes) -> int:
         """Send data."""
-        if get_state().get("trace"):
+        if trace_enabled():
             print(f"[socket] Send {len(data)} bytes")
 
         if self._real_socket:
@@ -83,7 +85,7 @@ class socket:
         """Send all data."""
         if self._real_socket:
             self._real_socket.sendall(data)
-        elif get_state().get("trace"):
+        elif trace_enabled():
             print(f"[socket] Sendall {len(data)} bytes (mock)")
 
     def sendto(self, data: bytes, address: Tuple[str, int]) -> int:
@@ -94,6 +96,10 @@ class socket:
 
     def recv(self, bufsize: int) -> bytes:
         """Receive data."""
+        if self._rxbuf:
+            data = bytes(self._rxbuf[:bufsize])
+            del self._rxbuf[:bufsize]
+            return data
         if self._real_socket:
             return self._real_socket.recv(bufsize)
         # Mock: return empty for non-blocking, block forever for blocking
@@ -112,16 +118,27 @@ class socket:
         return self.recv(size)
 
     def readline(self) -> bytes:
-        """Read a line."""
-        result = bytearray()
+        """Read a line.
+
+        Reads ahead in 4 KB chunks; bytes past the newline are kept for the
+        next recv()/read()/readline() call.
+        """
+        buf = self._rxbuf
+        start = 0
         while True:
-            c = self.recv(1)
-            if not c:
+            end = buf.find(b"\n", start)
+            if end >= 0:
+                end += 1
                 break
-            result.extend(c)
-            if c == b"\n":
+            start = len(buf)
+            chunk = self._real_socket.recv(4096) if self._real_socket else b""
+            if not chunk:
+                end = len(buf)
                 break
-        return bytes(result)
+            buf.extend(chunk)
+        line = bytes(buf[:end])
+        del buf[:end]
+        return line
 
     def write(self, data: bytes) -> int:
         """Write data (file-like interface)."""
@@ -133,7 +150,7 @@ class socket:
             self._real_socket.close()
             self._real_socket = None
         self._connected = False
-        if get_state().get("trace"):
+        if trace_enabled():
             print("[socket] Closed")
 
     def setblocking(self, flag: bool):
@@ -169,7 +186,7 @@ def getaddrinfo(
     flags: int = 0
 ) -> list:
     """Get address info for host."""
-    if get_state().get("trace"):
+    if trace_enabled():
         print(f"[socket] getaddrinfo({host}, {port})")
 
     return _socket.getaddrinfo(host, port, af, socktype, proto, flags)
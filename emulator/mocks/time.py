@@ -4,6 +4,7 @@ This module provides MicroPython-specific time functions while also
 passing through standard Python time functions for compatibility.
 """
 
+import calendar as _calendar
 import time as _time
 
 # Pass through standard Python time functions that other libraries need
@@ -42,22 +43,25 @@ def sleep_us(us: int):
     _time.sleep(us / 1_000_000)
 
 
-_start_time = _time.time()
+# Tick counters are integer nanoseconds since import on the monotonic
+# clock, so wall-clock adjustments never make them jump. They call the
+# module-level monotonic_ns binding above to skip the _time attribute lookup.
+_start_ns = monotonic_ns()
 
 
 def ticks_ms() -> int:
     """Return millisecond counter (wraps at 2^30)."""
-    return int((_time.time() - _start_time) * 1000) & 0x3FFFFFFF
+    return ((monotonic_ns() - _start_ns) // 1_000_000) & 0x3FFFFFFF
 
 
 def ticks_us() -> int:
     """Return microsecond counter (wraps at 2^30)."""
-    return int((_time.time() - _start_time) * 1_000_000) & 0x3FFFFFFF
+    return ((monotonic_ns() - _start_ns) // 1000) & 0x3FFFFFFF
 
 
 def ticks_cpu() -> int:
-    """Return CPU ticks (high resolution)."""
-    return int((_time.time() - _start_time) * 150_000_000) & 0x3FFFFFFF
+    """Return CPU ticks (high resolution, 150 MHz)."""
+    return ((monotonic_ns() - _start_ns) * 3 // 20) & 0x3FFFFFFF
 
 
 def ticks_add(ticks: int, delta: int) -> int:
@@ -80,7 +84,7 @@ def time() -> int:
 
 def time_ns() -> int:
     """Return nanoseconds since epoch."""
-    return int(_time.time() * 1_000_000_000)
+    return _time.time_ns()
 
 
 def localtime(secs: int = None) -> tuple:
@@ -103,5 +107,4 @@ def gmtime(secs: int = None) -> tuple:
 def mktime(t: tuple) -> int:
     """Convert time tuple to seconds since epoch."""
     # t = (year, month, mday, hour, minute, second, weekday, yearday)
-    import calendar
-    return calendar.timegm((t[0], t[1], t[2], t[3], t[4], t[5], 0, 0, 0))
+    return _calendar.timegm((t[0], t[1], t[2], t[3], t[4], t[5], 0, 0, 0))
@@ -3,7 +3,8 @@
 Provides touch button functionality and touch controller emulation.
 """
 
-from typing import List, Tuple
+import weakref
+from typing import Tuple
 
 from emulator import get_state
 from emulator.mocks.base import trace_log
@@ -12,7 +13,11 @@ from emulator.mocks.base import trace_log
 class Button:
     """Touch button that tracks touch regions."""
 
-    buttons: List["Button"] = []
+    # Live buttons only: screens that rebuild their buttons don't leave
+    # stale ones behind for FT6236.poll() to keep hit-testing.
+    buttons: "weakref.WeakSet[Button]" = weakref.WeakSet()
+    # Bumped whenever the set of buttons is changed explicitly
+    _generation = 0
 
     def __init__(self, x: int, y: int, w: int, h: int):
         self.x = x
@@ -20,7 +25,8 @@ class Button:
         self.w = w
         self.h = h
         self.pressed = False
-        Button.buttons.append(self)
+        Button.buttons.add(self)
+        Button._generation += 1
 
     def is_pressed(self) -> bool:
         """Check if button is currently pressed."""
@@ -34,7 +40,8 @@ class Button:
     @classmethod
     def clear_buttons(cls):
         """Clear all registered buttons."""
-        cls.buttons = []
+        cls.buttons.clear()
+        cls._generation += 1
 
 
 class FT6236:
@@ -67,6 +74,9 @@ class FT6236:
         self.distance = 0
         self.angle = 0
 
+        # Touch input the buttons were last updated for (see poll)
+        self._last_input = None
+
         # Register with emulator state
         get_state()["touch_controller"] = self
         trace_log("FT6236", f"Initialized, full_res={full_res}")
@@ -90,26 +100,32 @@ class FT6236:
             self.x = int(self.x / self._scale)
             self.y = int(self.y / self._scale)
 
-        # Update all registered buttons
-        for button in Button.buttons:
-            if self.state:
-                # Check if primary touch is in button bounds
-                if (button.x <= self.x <= button.x + button.w and
-                    button.y <= self.y <= button.y + button.h):
-                    button.pressed = True
-                # Check secondary touch
-                elif (self.state2 and
-                      button.x <= self.x2 <= button.x + button.w and
-                      button.y2 <= self.y2 <= button.y + button.h):
-                    button.pressed = True
-                else:
-                    button.pressed = False
-            else:
-                button.pressed = False
+        # Button states only change when the touch input or the button
+        # list does; idle frames skip the hit tests.
+        key = (self.x, self.y, self.state, self.state2, self.x2, self.y2, Button._generation)
+        if key != self._last_input:
+            self._last_input = key
+            self._update_buttons(Button.buttons)
 
         if self.debug:
             print(f"[FT6236] x={self.x}, y={self.y}, state={self.state}")
 
+    def _update_buttons(self, buttons):
+        """Set each button's pressed flag from the current touch points."""
+        if not self.state:
+            for button in buttons:
+                button.pressed = False
+        else:
+            x, y = self.x, self.y
+            second = self.state2
+            x2, y2 = self.x2, self.y2
+            for button in buttons:
+                bx, by = button.x, button.y
+                bx2, by2 = bx + button.w, by + button.h
+                # Primary touch, then secondary touch, in button bounds
+                button.pressed = ((bx <= x <= bx2 and by <= y <= by2) or
+                                  (second and bx <= x2 <= bx2 and by <= y2 <= by2))
+
     def _set_touch(self, x: int, y: int, pressed: bool):
         """Set touch state (called by emulator)."""
         self.x = x
@@ -1,6 +1,6 @@
 """Mock implementation of Tufty 2350 device module."""
 
-from emulator import get_state
+from emulator import get_state, trace_enabled
 from emulator.mocks.picographics import DISPLAY_TUFTY_2350, PEN_RGB565, PicoGraphics
 
 # Button pin definitions (matching real hardware)
@@ -20,6 +20,10 @@ LIGHT_SENSE = 26
 # Display backlight pin
 BACKLIGHT = 2
 
+# The emulator state dict is a module-level singleton (reset in place),
+# so the module helpers below can keep a reference to it.
+_state = get_state()
+
 
 class Tufty2350:
     """Tufty 2350 device controller."""
@@ -51,7 +55,7 @@ class Tufty2350:
         state = get_state()
         state["tufty2350"] = self
 
-        if state.get("trace"):
+        if trace_enabled():
             print("[Tufty2350] Initialized")
 
     def set_backlight(self, brightness: float):
@@ -83,8 +87,7 @@ class Tufty2350:
 # Convenience functions for button reading
 def pressed(button_pin: int) -> bool:
     """Check if button is pressed."""
-    state = get_state()
-    tufty = state.get("tufty2350")
+    tufty = _state.get("tufty2350")
     if tufty:
         return tufty.button(button_pin)
     return False
@@ -92,8 +95,7 @@ def pressed(button_pin: int) -> bool:
 
 def read_light() -> int:
     """Read light sensor value."""
-    state = get_state()
-    tufty = state.get("tufty2350")
+    tufty = _state.get("tufty2350")
     if tufty:
         return tufty.light()
     return 32768
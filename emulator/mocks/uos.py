@@ -8,7 +8,7 @@ virtual filesystem root.
 import os as _real_os
 from pathlib import Path
 
-from emulator import get_state
+from emulator import get_state, trace_enabled
 
 
 def _get_vfs_root() -> str:
@@ -17,37 +17,32 @@ def _get_vfs_root() -> str:
     return state.get("vfs_root", "/tmp/badger_vfs")
 
 
+# Host-side paths that never refer to the device filesystem
+_PASSTHROUGH = ("/tmp/", "/dev/", "/proc/", "/sys/")
+
+
 def _translate_path(path: str) -> str:
     """Translate MicroPython absolute path to host filesystem path.
 
     Checks mount points first (e.g. /sd/ -> local dir), then falls back
     to the VFS root for paths like "/badges/badge.txt".
     """
-    if not path:
+    if not path or path[0] != "/" or path.startswith(_PASSTHROUGH):
         return path
 
-    # If it's an absolute path (starts with /)
-    if path.startswith("/"):
-        # Check mount points first (longest prefix match)
-        for mount_path, local_path in sorted(_mount_points.items(), key=lambda x: -len(x[0])):
-            if path == mount_path or path.startswith(mount_path + "/"):
-                remainder = path[len(mount_path):].lstrip("/")
-                translated = _real_os.path.join(local_path, remainder)
-                state = get_state()
-                if state.get("trace"):
-                    print(f"[uos] Translating '{path}' -> '{translated}' (mount: {mount_path})")
-                return translated
-
-        vfs_root = _get_vfs_root()
-        translated = _real_os.path.join(vfs_root, path.lstrip("/"))
-
-        state = get_state()
-        if state.get("trace"):
-            print(f"[uos] Translating '{path}' -> '{translated}'")
-
-        return translated
+    # Check mount points first (longest prefix match)
+    for mount_path, prefix, local_path in _mount_order:
+        if path == mount_path or path.startswith(prefix):
+            remainder = path[len(mount_path):].lstrip("/")
+            translated = _real_os.path.join(local_path, remainder)
+            if trace_enabled():
+                print(f"[uos] Translating '{path}' -> '{translated}' (mount: {mount_path})")
+            return translated
 
-    return path
+    translated = _real_os.path.join(_get_vfs_root(), path.lstrip("/"))
+    if trace_enabled():
+        print(f"[uos] Translating '{path}' -> '{translated}'")
+    return translated
 
 
 def getcwd() -> str:
@@ -123,6 +118,14 @@ def sync():
 
 
 _mount_points = {}
+# (mount_path, mount_path + "/", local_path), longest mount path first
+_mount_order = []
+
+
+def _update_mount_order():
+    """Rebuild the prefix-match order after _mount_points changes."""
+    _mount_order[:] = [(mount_path, mount_path + "/", local_path)
+                       for mount_path, local_path in sorted(_mount_points.items(), key=lambda x: -len(x[0]))]
 
 
 def mount(filesystem, path: str, readonly: bool = False):
@@ -140,6 +143,7 @@ def mount(filesystem, path: str, readonly: bool = False):
         # Normalize mount path (ensure it starts with / and has no trailing /)
         mount_path = "/" + path.strip("/")
         _mount_points[mount_path] = local_path
+        _update_mount_order()
 
         state = get_state()
         if state.get("trace"):
@@ -150,6 +154,7 @@ def umount(path: str):
     """Unmount a filesystem."""
     mount_path = "/" + path.strip("/")
     _mount_points.pop(mount_path, None)
+    _update_mount_order()
 
 
 def dupterm(stream, index: int = 0):
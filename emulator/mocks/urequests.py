@@ -3,7 +3,9 @@
 Provides HTTP client functionality using Python's requests library.
 """
 
-from emulator import get_state
+import io
+
+from emulator import trace_enabled
 
 try:
     import requests as _requests
@@ -15,8 +17,10 @@ except ImportError:
 class Response:
     """HTTP response wrapper matching MicroPython's urequests.Response."""
 
-    def __init__(self, requests_response):
+    def __init__(self, requests_response, stream: bool = False):
         self._response = requests_response
+        self._stream = stream
+        self._raw = None
         self.status_code = requests_response.status_code
         self.reason = requests_response.reason
         self.headers = dict(requests_response.headers)
@@ -30,6 +34,30 @@ class Response:
             self._content = self._response.content
         return self._content
 
+    @property
+    def raw(self):
+        """Get the body as a stream supporting ``read(n)``, like MicroPython's socket.
+
+        Content encodings (gzip etc.) are decoded, as the device never
+        sees them. The body is read from the network as it is consumed
+        only if the request was made with ``stream=True``.
+        """
+        if self._raw is None:
+            if self._stream and self._content is None:
+                self._raw = self._response.raw
+                self._raw.decode_content = True
+            else:
+                self._raw = io.BytesIO(self.content)
+        return self._raw
+
+    def iter_content(self, chunk_size: int = 1024):
+        """Yield the body in chunks without holding all of it in memory."""
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i:i + chunk_size]
+            return
+        yield from self._response.iter_content(chunk_size)
+
     @property
     def text(self) -> str:
         """Get response content as text."""
@@ -61,15 +89,15 @@ def request(method: str, url: str, data=None, json=None, headers=None,
     Returns:
         Response object
     """
-    state = get_state()
-
-    if state.get("trace"):
+    if trace_enabled():
         print(f"[urequests] {method} {url}")
 
     if not _HAS_REQUESTS:
         raise OSError("requests library not installed")
 
-    # Use real requests library
+    # Use real requests library. Pass stream=True to have .raw and
+    # iter_content() read the body incrementally; otherwise it is
+    # downloaded (and the connection released) before returning.
     resp = _requests.request(
         method=method,
         url=url,
@@ -80,7 +108,7 @@ def request(method: str, url: str, data=None, json=None, headers=None,
         **kwargs
     )
 
-    return Response(resp)
+    return Response(resp, stream=kwargs.get("stream", False))
 
 
 def get(url: str, **kwargs) -> Response:
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
-from emulator import get_display, get_state
+from emulator import get_display, trace_enabled
 
 _recording = False
 _recording_dir: Optional[Path] = None
@@ -50,7 +50,7 @@ def start_recording(output_dir: str):
     if display:
         display.set_autosave(output_dir)
 
-    if get_state().get("trace"):
+    if trace_enabled():
         print(f"[capture] Started recording to {output_dir}")
 
 
@@ -70,7 +70,7 @@ def stop_recording() -> int:
     _recording = False
     _recording_dir = None
 
-    if get_state().get("trace"):
+    if trace_enabled():
         print(f"[capture] Stopped recording. {frames} frames captured.")
 
     return frames
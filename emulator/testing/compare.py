@@ -1,13 +1,19 @@
 """Image comparison utilities for visual regression testing."""
 
-import math
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Dict, Optional, Tuple, Union
 
-from PIL import Image
+from PIL import Image, ImageChops, ImageMath
 
 from emulator import get_display, get_state
 
+# Pixels closer than a colour distance of 10 (~4% per channel) count as
+# matching; compared squared so matching pixels need no sqrt.
+_MATCH_DIST2 = 10 * 10
+
+# Decoded reference images by resolved path, as (mtime_ns, image)
+_expected_cache: Dict[str, Tuple[int, Image.Image]] = {}
+
 
 def compare_images(
     image1: Union[str, Path, Image.Image],
@@ -24,16 +30,10 @@ def compare_images(
     Returns:
         Tuple of (match: bool, similarity: float, diff_image: Image or None)
     """
-    # Load images
-    if isinstance(image1, (str, Path)):
-        img1 = Image.open(image1).convert("RGB")
-    else:
-        img1 = image1.convert("RGB")
-
-    if isinstance(image2, (str, Path)):
-        img2 = Image.open(image2).convert("RGB")
-    else:
-        img2 = image2.convert("RGB")
+    # Load images; Image.open only reads the header, so sizes can be
+    # checked before any pixel data is decoded or converted
+    img1 = Image.open(image1) if isinstance(image1, (str, Path)) else image1
+    img2 = Image.open(image2) if isinstance(image2, (str, Path)) else image2
 
     # Check dimensions match
     if img1.size != img2.size:
@@ -43,41 +43,15 @@ def compare_images(
         diff = Image.new("RGB", (max_w, max_h), (255, 0, 0))
         return False, 0.0, diff
 
-    # Calculate pixel-by-pixel difference
-    pixels1 = img1.load()
-    pixels2 = img2.load()
+    img1 = img1.convert("RGB")
+    img2 = img2.convert("RGB")
 
     width, height = img1.size
     total_pixels = width * height
-    matching_pixels = 0
-    diff_pixels = []
-
-    for y in range(height):
-        for x in range(width):
-            p1 = pixels1[x, y]
-            p2 = pixels2[x, y]
-
-            # Calculate color distance
-            dr = abs(p1[0] - p2[0])
-            dg = abs(p1[1] - p2[1])
-            db = abs(p1[2] - p2[2])
-            distance = math.sqrt(dr * dr + dg * dg + db * db)
-
-            # Pixels are "matching" if very close (allow for anti-aliasing)
-            if distance < 10:  # ~4% tolerance per channel
-                matching_pixels += 1
-                diff_pixels.append((0, 0, 0))  # Black = match
-            else:
-                # Highlight difference
-                intensity = min(255, int(distance))
-                diff_pixels.append((255, intensity, intensity))  # Red = diff
+    matching_pixels, diff = _diff_images(img1, img2)
 
     similarity = matching_pixels / total_pixels if total_pixels > 0 else 0
 
-    # Create diff image
-    diff = Image.new("RGB", (width, height))
-    diff.putdata(diff_pixels)
-
     match = similarity >= threshold
 
     if get_state().get("trace"):
@@ -86,6 +60,53 @@ def compare_images(
     return match, similarity, diff
 
 
+def _diff_images(img1: Image.Image, img2: Image.Image) -> Tuple[int, Image.Image]:
+    """Count matching pixels and build the diff image.
+
+    Matching pixels are black in the diff; the rest are red, shaded by
+    their colour distance. Everything runs in PIL's C loops, and only over
+    the bounding box of the pixels that differ at all.
+    """
+    width, height = img1.size
+    diff = Image.new("RGB", (width, height))
+    delta = ImageChops.difference(img1, img2)
+    bbox = delta.getbbox()
+    if bbox is None:
+        return width * height, diff
+
+    dr, dg, db = delta.crop(bbox).split()
+    dist2 = ImageMath.lambda_eval(
+        lambda m: m["convert"](m["r"], "I") * m["r"]
+        + m["convert"](m["g"], "I") * m["g"]
+        + m["convert"](m["b"], "I") * m["b"],
+        r=dr, g=dg, b=db,
+    )
+    mismatch = ImageMath.lambda_eval(
+        lambda m: (m["d"] >= _MATCH_DIST2) * 255, d=dist2
+    ).convert("L")
+    # Only the differing pixels need a real distance for the diff intensity
+    intensity = ImageMath.lambda_eval(
+        lambda m: m["int"](m["min"](m["float"](m["d"]) ** 0.5, 255)) * (m["d"] >= _MATCH_DIST2),
+        d=dist2,
+    ).convert("L")
+    diff.paste(Image.merge("RGB", (mismatch, intensity, intensity)), bbox[:2])
+
+    outside = width * height - dr.width * dr.height
+    return outside + mismatch.histogram()[0], diff
+
+
+def _load_expected(path: Path) -> Image.Image:
+    """Decode a reference image, reusing it until the file changes."""
+    key = str(path.resolve())
+    mtime = path.stat().st_mtime_ns
+    cached = _expected_cache.get(key)
+    if cached is None or cached[0] != mtime:
+        with Image.open(path) as img:
+            cached = (mtime, img.convert("RGB"))
+        _expected_cache[key] = cached
+    return cached[1]
+
+
 def assert_display_matches(
     expected_path: Union[str, Path],
     threshold: float = 0.99,
@@ -131,7 +152,7 @@ def assert_display_matches(
         return True
 
     # Compare
-    match, similarity, diff = compare_images(current, expected_path, threshold)
+    match, similarity, diff = compare_images(current, _load_expected(expected_path), threshold)
 
     if not match:
         if save_diff:
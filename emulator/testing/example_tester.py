@@ -8,13 +8,20 @@ Usage:
 
 import argparse
 import json
+import os
+import queue
+import re
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import List, Optional
 
+from emulator.testing.worker import Worker
+
 
 @dataclass
 class TestResult:
@@ -27,7 +34,27 @@ class TestResult:
     error_type: Optional[str] = None  # "import", "attribute", "blank", "timeout", "other"
     missing_module: Optional[str] = None
     missing_attr: Optional[str] = None
-    output: Optional[str] = None
+    output: Optional[str] = None  # stdout + stderr, kept unless the run passed
+
+
+# Error signatures in priority order. Each is searched for on its own: a
+# single alternation would let a lower-priority signature that appears
+# first on a line swallow a higher-priority one later on it.
+_ERROR_PATTERNS = tuple((kind, re.compile(pattern)) for kind, pattern in (
+    ("import", r"ModuleNotFoundError: No module named '([^']+)'"),
+    ("import", r"ImportError: No module named ([^\s]+)"),
+    ("import", r"No module named '([^']+)'"),
+    ("attribute", r"AttributeError: '([^']+)' object has no attribute '([^']+)'"),
+    ("attribute", r"AttributeError: module '([^']+)' has no attribute '([^']+)'"),
+    ("attribute", r"has no attribute '([^']+)'"),
+    ("name", r"NameError: name '([^']+)' is not defined"),
+    ("file", r"FileNotFoundError:.*'([^']+)'"),
+    ("type", r"TypeError: ([^\n]+)"),
+    ("syntax", r"SyntaxError"),
+))
+_FRAMES_RE = re.compile(r"Rendered (\d+) frames")
+
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 
 def categorize_error(stderr: str, stdout: str) -> tuple:
@@ -37,53 +64,26 @@ def categorize_error(stderr: str, stdout: str) -> tuple:
     """
     full_output = stderr + stdout
 
-    # Check for missing module
-    import_patterns = [
-        r"ModuleNotFoundError: No module named '([^']+)'",
-        r"ImportError: No module named ([^\s]+)",
-        r"No module named '([^']+)'",
-    ]
-    import re
-    for pattern in import_patterns:
-        match = re.search(pattern, full_output)
-        if match:
+    for kind, pattern in _ERROR_PATTERNS:
+        match = pattern.search(full_output)
+        if not match:
+            continue
+        if kind == "import":
             module = match.group(1)
             return ("import", module, None, f"Missing module: {module}")
-
-    # Check for missing attribute/method
-    attr_patterns = [
-        r"AttributeError: '([^']+)' object has no attribute '([^']+)'",
-        r"AttributeError: module '([^']+)' has no attribute '([^']+)'",
-        r"has no attribute '([^']+)'",
-    ]
-    for pattern in attr_patterns:
-        match = re.search(pattern, full_output)
-        if match:
-            if len(match.groups()) == 2:
+        if kind == "attribute":
+            if pattern.groups == 2:
                 obj, attr = match.groups()
                 return ("attribute", None, f"{obj}.{attr}", f"Missing: {obj}.{attr}")
-            else:
-                attr = match.group(1)
-                return ("attribute", None, attr, f"Missing attribute: {attr}")
-
-    # Check for NameError
-    name_match = re.search(r"NameError: name '([^']+)' is not defined", full_output)
-    if name_match:
-        name = name_match.group(1)
-        return ("name", None, name, f"Undefined name: {name}")
-
-    # Check for file not found
-    file_match = re.search(r"FileNotFoundError:.*'([^']+)'", full_output)
-    if file_match:
-        return ("file", None, None, "File not found")
-
-    # Check for TypeError (often means wrong API usage)
-    type_match = re.search(r"TypeError: ([^\n]+)", full_output)
-    if type_match:
-        return ("type", None, None, f"TypeError: {type_match.group(1)[:50]}")
-
-    # Check for syntax errors
-    if "SyntaxError" in full_output:
+            attr = match.group(1)
+            return ("attribute", None, attr, f"Missing attribute: {attr}")
+        if kind == "name":
+            name = match.group(1)
+            return ("name", None, name, f"Undefined name: {name}")
+        if kind == "file":
+            return ("file", None, None, "File not found")
+        if kind == "type":
+            return ("type", None, None, f"TypeError: {match.group(1)[:50]}")
         return ("syntax", None, None, "Syntax error")
 
     # Generic error - extract last exception line
@@ -109,27 +109,25 @@ class TestReport:
     results: List[TestResult] = field(default_factory=list)
 
 
+def _walk_examples(root: str, pattern: str):
+    """Yield example files under root, pruning __pycache__ and hidden directories."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name != "__pycache__" and not name.startswith("."):
+                    yield from _walk_examples(entry.path, pattern)
+            elif name.startswith("__") or name.startswith("."):
+                continue
+            elif fnmatch(name, pattern) and name not in ("setup.py", "conftest.py", "secrets.py"):
+                yield Path(entry.path)
+
+
 def find_examples(path: Path, pattern: str = "*.py") -> List[Path]:
     """Find all Python example files."""
-    examples = []
-
     if path.is_file():
-        if path.suffix == ".py":
-            examples.append(path)
-    else:
-        # Recursively find all .py files
-        for py_file in path.rglob(pattern):
-            # Skip __init__.py, __pycache__, setup.py, etc.
-            name = py_file.name
-            if name.startswith("__") or name.startswith("."):
-                continue
-            if name in ("setup.py", "conftest.py", "secrets.py"):
-                continue
-            if "__pycache__" in str(py_file):
-                continue
-            examples.append(py_file)
-
-    return sorted(examples)
+        return [path] if path.suffix == ".py" else []
+    return sorted(_walk_examples(str(path), pattern))
 
 
 def test_example(
@@ -137,46 +135,53 @@ def test_example(
     device: Optional[str] = None,
     timeout: int = 10,
     max_frames: int = 5,
+    worker: Optional[Worker] = None,
 ) -> TestResult:
-    """Test a single example script."""
+    """Test a single example script.
+
+    Runs ``python -m emulator`` in a new interpreter, or in a fork of
+    ``worker`` when one is given (falling back to a new interpreter if
+    the worker has died).
+    """
     result = TestResult(path=str(example), status="unknown")
 
     # Build command
-    cmd = [
-        sys.executable, "-m", "emulator",
+    args = [
         "--headless",
         "--max-frames", str(max_frames),
     ]
 
     if device:
-        cmd.extend(["--device", device])
+        args.extend(["--device", device])
 
-    cmd.append(str(example))
+    args.append(str(example))
 
     start = time.time()
 
     try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=Path(__file__).parent.parent.parent,  # Project root
-        )
+        proc = None
+        if worker:
+            try:
+                proc = worker.run(args, timeout)
+            except RuntimeError:
+                proc = None
+        if proc is None:
+            proc = subprocess.run(
+                [sys.executable, "-m", "emulator"] + args,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=_PROJECT_ROOT,
+            )
 
         result.duration = time.time() - start
-        result.output = proc.stdout + proc.stderr
-
-        # Parse frame count from output
-        for line in result.output.split("\n"):
-            if "Rendered" in line and "frames" in line:
-                try:
-                    # "Emulator finished. Rendered N frames."
-                    parts = line.split()
-                    idx = parts.index("Rendered")
-                    result.frames = int(parts[idx + 1])
-                except (ValueError, IndexError):
-                    pass
+
+        # "Emulator finished. Rendered N frames." - the whole output is
+        # searched (more may be printed after it) and the last count wins
+        output = proc.stdout + proc.stderr
+        frame_counts = _FRAMES_RE.findall(output)
+        if frame_counts:
+            result.frames = int(frame_counts[-1])
 
         # Check for errors in output even if return code is 0
         # (emulator returns 0 even if app crashes)
@@ -201,10 +206,6 @@ def test_example(
                 result.error_type = "blank"
         else:
             result.status = "error"
-            # Categorize the error
-            error_type, missing_mod, missing_attr, error_summary = categorize_error(
-                proc.stderr, proc.stdout
-            )
             result.error_type = error_type
             result.missing_module = missing_mod
             result.missing_attr = missing_attr
@@ -220,6 +221,10 @@ def test_example(
                 else:
                     result.error = f"Exit code {proc.returncode}"
 
+        # Only keep the (possibly large) output for runs worth looking at
+        if result.status != "pass":
+            result.output = output
+
     except subprocess.TimeoutExpired:
         result.duration = timeout
         result.status = "timeout"
@@ -240,8 +245,17 @@ def run_tests(
     timeout: int = 10,
     max_frames: int = 5,
     verbose: bool = False,
+    jobs: Optional[int] = None,
+    preload: bool = True,
 ) -> TestReport:
-    """Run tests on all examples."""
+    """Run tests on all examples.
+
+    Examples run as parallel subprocesses, ``jobs`` at a time (default: one
+    per CPU). With ``preload`` (and os.fork available) each job forks from
+    a worker that has already imported the emulator, instead of starting a
+    new interpreter per example. Progress is printed as each finishes;
+    ``report.results`` keeps the order the examples were found in.
+    """
     report = TestReport()
 
     # Find all examples
@@ -252,43 +266,70 @@ def run_tests(
     report.total = len(examples)
     print(f"Found {report.total} examples to test\n")
 
-    for i, example in enumerate(examples, 1):
-        # Progress indicator
-        rel_path = example.name
-        print(f"[{i}/{report.total}] Testing {rel_path}...", end=" ", flush=True)
-
-        result = test_example(
-            example,
-            device=device,
-            timeout=timeout,
-            max_frames=max_frames,
-        )
+    # No more workers than examples; os.cpu_count() may be None
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(examples)))
+    idle = queue.Queue()
+    for _ in range(jobs):
+        idle.put(Worker(_PROJECT_ROOT) if preload and hasattr(os, "fork") else None)
+
+    def run_one(example: Path) -> TestResult:
+        worker = idle.get()
+        try:
+            return test_example(
+                example,
+                device=device,
+                timeout=timeout,
+                max_frames=max_frames,
+                worker=worker,
+            )
+        finally:
+            # A worker that died would fail every later example on this slot
+            if worker and not worker.alive:
+                worker.close()
+                worker = Worker(_PROJECT_ROOT)
+            idle.put(worker)
+
+    results = [None] * report.total
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_one, example): index for index, example in enumerate(examples)}
+
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results[futures[future]] = result
+
+            # Progress indicator
+            rel_path = Path(result.path).name
+            print(f"[{done}/{report.total}] Testing {rel_path}...", end=" ", flush=True)
+
+            # Update counts
+            if result.status == "pass":
+                report.passed += 1
+                print(f"\033[32mPASS\033[0m ({result.frames} frames, {result.duration:.1f}s)")
+            elif result.status == "timeout":
+                report.timeouts += 1
+                print("\033[33mTIMEOUT\033[0m")
+            elif result.status == "skip":
+                report.skipped += 1
+                print("\033[36mSKIP\033[0m")
+            elif result.status == "unknown":
+                report.unknown += 1
+                print("\033[33mUNKNOWN\033[0m (no frames)")
+            elif result.status == "fail":
+                report.failed += 1
+                print("\033[31mFAIL\033[0m")
+            else:
+                report.errors += 1
+                print("\033[31mERROR\033[0m")
 
-        report.results.append(result)
-
-        # Update counts
-        if result.status == "pass":
-            report.passed += 1
-            print(f"\033[32mPASS\033[0m ({result.frames} frames, {result.duration:.1f}s)")
-        elif result.status == "timeout":
-            report.timeouts += 1
-            print("\033[33mTIMEOUT\033[0m")
-        elif result.status == "skip":
-            report.skipped += 1
-            print("\033[36mSKIP\033[0m")
-        elif result.status == "unknown":
-            report.unknown += 1
-            print("\033[33mUNKNOWN\033[0m (no frames)")
-        elif result.status == "fail":
-            report.failed += 1
-            print("\033[31mFAIL\033[0m")
-        else:
-            report.errors += 1
-            print("\033[31mERROR\033[0m")
+            if verbose and result.error:
+                print(f"    Error: {result.error[:200]}")
 
-        if verbose and result.error:
-            print(f"    Error: {result.error[:200]}")
+    while not idle.empty():
+        worker = idle.get()
+        if worker:
+            worker.close()
 
+    report.results = results
     return report
 
 
@@ -376,6 +417,9 @@ def main():
     parser.add_argument("-d", "--device", help="Device to emulate")
     parser.add_argument("-t", "--timeout", type=int, default=10, help="Timeout per test (seconds)")
     parser.add_argument("-f", "--max-frames", type=int, default=5, help="Max frames per test")
+    parser.add_argument("-j", "--jobs", type=int, help="Examples to run in parallel (default: CPU count)")
+    parser.add_argument("--no-preload", action="store_true",
+                        help="Start a new interpreter per example instead of forking a pre-loaded worker")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show error details")
     parser.add_argument("--json", metavar="FILE", help="Write JSON report to file")
 
@@ -387,6 +431,8 @@ def main():
         timeout=args.timeout,
         max_frames=args.max_frames,
         verbose=args.verbose,
+        jobs=args.jobs,
+        preload=not args.no_preload,
     )
 
     print_summary(report)
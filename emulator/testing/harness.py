@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Optional
 from unittest import TestCase
 
-from emulator import _emulator_state, get_state
+from emulator import _emulator_state, get_state, wait_for_frame
 from emulator.devices import get_device
 from emulator.display import create_display
 from emulator.hardware.buttons import ButtonManager
@@ -139,14 +139,10 @@ class DeviceTest(TestCase):
             timeout: Maximum time to wait
         """
         start_frame = get_state().get("frame_count", 0)
-        target_frame = start_frame + count
-        start_time = time.time()
-
-        while get_state().get("frame_count", 0) < target_frame:
-            if time.time() - start_time > timeout:
-                actual = get_state().get("frame_count", 0) - start_frame
-                self.fail(f"Timeout waiting for frames. Got {actual}/{count}")
-            time.sleep(0.01)
+
+        if not wait_for_frame(start_frame + count, timeout):
+            actual = get_state().get("frame_count", 0) - start_frame
+            self.fail(f"Timeout waiting for frames. Got {actual}/{count}")
 
     def press_button(self, name: str):
         """Press a button by name (A, B, C, UP, DOWN)."""
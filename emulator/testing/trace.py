@@ -1,8 +1,10 @@
 """API call tracing for debugging."""
 
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 from emulator import get_state
 
@@ -17,8 +19,12 @@ class TraceEntry:
     kwargs: Dict[str, Any]
     result: Any = None
     error: Optional[str] = None
+    _line: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self):
+        if self._line is not None:
+            return self._line
+
         args_str = ", ".join(repr(a) for a in self.args)
         kwargs_str = ", ".join(f"{k}={v!r}" for k, v in self.kwargs.items())
         all_args = ", ".join(filter(None, [args_str, kwargs_str]))
@@ -27,14 +33,34 @@ class TraceEntry:
         result_str = f" -> {self.result!r}" if self.result is not None else ""
         error_str = f" ERROR: {self.error}" if self.error else ""
 
-        return f"[{time_str}] {self.module}.{self.function}({all_args}){result_str}{error_str}"
+        self._line = f"[{time_str}] {self.module}.{self.function}({all_args}){result_str}{error_str}"
+        return self._line
 
 
-# Global trace log
-_trace_log: List[TraceEntry] = []
+# Global trace log: the most recent calls as raw
+# (time, module, function, args, kwargs, result, error, line) tuples, where
+# line is the text echoed when the call was logged; wrapped in TraceEntry
+# only when read back
+_TRACE_LOG_SIZE = 100_000
+_trace_log: Deque[tuple] = deque(maxlen=_TRACE_LOG_SIZE)
 _tracing_enabled = False
 
 
+def _entry(raw: tuple) -> TraceEntry:
+    """Build a TraceEntry from a raw log tuple."""
+    timestamp, module, function, args, kwargs, result, error, line = raw
+    entry = TraceEntry(datetime.fromtimestamp(timestamp), module, function, args, kwargs or {}, result, error)
+    entry._line = line
+    return entry
+
+
+def _record(raw: tuple):
+    """Format a raw entry once, append it to the log and echo it."""
+    line = str(_entry(raw + (None,)))
+    _trace_log.append(raw + (line,))
+    print(line)
+
+
 def enable_tracing():
     """Enable API call tracing."""
     global _tracing_enabled
@@ -69,19 +95,7 @@ def log_call(module: str, function: str, args: tuple = (), kwargs: dict = None,
     if not _tracing_enabled:
         return
 
-    entry = TraceEntry(
-        timestamp=datetime.now(),
-        module=module,
-        function=function,
-        args=args,
-        kwargs=kwargs or {},
-        result=result,
-    )
-
-    _trace_log.append(entry)
-
-    # Also print to stderr
-    print(entry)
+    _record((time.time(), module, function, args, kwargs, result, None))
 
 
 def log_error(module: str, function: str, error: str, args: tuple = (), kwargs: dict = None):
@@ -89,35 +103,23 @@ def log_error(module: str, function: str, error: str, args: tuple = (), kwargs:
     if not _tracing_enabled:
         return
 
-    entry = TraceEntry(
-        timestamp=datetime.now(),
-        module=module,
-        function=function,
-        args=args,
-        kwargs=kwargs or {},
-        error=error,
-    )
-
-    _trace_log.append(entry)
-    print(entry)
+    _record((time.time(), module, function, args, kwargs, None, error))
 
 
 def get_trace_log() -> List[TraceEntry]:
-    """Get the trace log."""
-    return list(_trace_log)
+    """Get the trace log (the most recent entries, oldest first)."""
+    return [_entry(raw) for raw in _trace_log]
 
 
 def clear_trace_log():
     """Clear the trace log."""
-    global _trace_log
-    _trace_log = []
+    _trace_log.clear()
 
 
 def save_trace_log(filename: str):
     """Save trace log to file."""
     with open(filename, "w") as f:
-        for entry in _trace_log:
-            f.write(str(entry) + "\n")
+        f.writelines(raw[-1] + "\n" for raw in _trace_log)
     print(f"[trace] Saved {len(_trace_log)} entries to {filename}")
 
 
@@ -131,12 +133,8 @@ def filter_trace_log(module: Optional[str] = None, function: Optional[str] = Non
     Returns:
         Filtered list of trace entries
     """
-    result = _trace_log
-
-    if module:
-        result = [e for e in result if e.module == module]
-
-    if function:
-        result = [e for e in result if e.function == function]
-
-    return result
+    return [
+        _entry(raw)
+        for raw in _trace_log
+        if (not module or raw[1] == module) and (not function or raw[2] == function)
+    ]
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Pre-loaded emulator worker for the example tester.
+
+Starting ``python -m emulator`` for every example spends most of its time
+importing the emulator and its mocks. A worker imports them once, then
+forks a child per request, so each example still gets a fresh process
+without paying for the imports again.
+
+Protocol: one JSON object per line on stdin,
+``{"argv": [...emulator args...], "timeout": seconds}``, answered by one
+JSON line on stdout, ``{"returncode": int, "stdout": str, "stderr": str,
+"timed_out": bool}``. Workers need ``os.fork`` (not available on Windows).
+
+Usage:
+    python -m emulator.testing.worker
+"""
+
+import importlib
+import json
+import os
+import pkgutil
+import selectors
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from pathlib import Path
+from typing import List, Optional
+
+# How long past an example's timeout the client waits for a reply; the
+# worker enforces the timeout itself, so this only catches a wedged worker
+_REPLY_GRACE = 5.0
+
+
+def _preload():
+    """Import the emulator and every mock module ahead of the first fork."""
+    import emulator.main  # noqa: F401
+    import emulator.mocks
+
+    for module in pkgutil.iter_modules(emulator.mocks.__path__, "emulator.mocks."):
+        try:
+            importlib.import_module(module.name)
+        except Exception:
+            # Report it from the child that actually needs the module
+            pass
+
+
+def _run_child(argv: List[str], stdout_fd: int, stderr_fd: int):
+    """Run the emulator as ``python -m emulator`` would, then exit."""
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+    code = 0
+    try:
+        from emulator.main import main
+
+        sys.argv = ["emulator"] + argv
+        main()
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    os._exit(code)
+
+
+def _run(argv: List[str], timeout: float) -> dict:
+    """Fork a child for one emulator run and collect its result."""
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(argv, out.fileno(), err.fileno())
+
+        deadline = time.monotonic() + timeout
+        timed_out = False
+        while True:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                break
+            if time.monotonic() > deadline:
+                os.kill(pid, signal.SIGKILL)
+                _, status = os.waitpid(pid, 0)
+                timed_out = True
+                break
+            time.sleep(0.01)
+
+        out.seek(0)
+        err.seek(0)
+        return {
+            "returncode": os.waitstatus_to_exitcode(status),
+            "stdout": out.read().decode(errors="replace"),
+            "stderr": err.read().decode(errors="replace"),
+            "timed_out": timed_out,
+        }
+
+
+def serve():
+    """Answer run requests from stdin until it is closed."""
+    # Keep replies on a private copy of stdout so nothing printed while
+    # preloading (or by a child) can end up in the protocol stream
+    replies = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    _preload()
+    for line in sys.stdin:
+        request = json.loads(line)
+        reply = _run(request["argv"], request["timeout"])
+        replies.write(json.dumps(reply) + "\n")
+        replies.flush()
+
+
+class Worker:
+    """Client side of a worker process (see module docstring)."""
+
+    def __init__(self, cwd: Path):
+        self._proc = subprocess.Popen(
+            [sys.executable, "-m", "emulator.testing.worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=cwd,
+            # Own process group, so a wedged worker goes down with its child
+            start_new_session=True,
+        )
+
+    def run(self, argv: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run ``python -m emulator *argv`` in a fresh fork.
+
+        Returns and raises like ``subprocess.run(..., capture_output=True,
+        text=True, timeout=timeout)``. A worker that does not answer in
+        time is killed, so ``alive`` is False afterwards.
+        """
+        try:
+            self._proc.stdin.write(json.dumps({"argv": argv, "timeout": timeout}) + "\n")
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            line = ""
+        else:
+            line = self._read_reply(timeout + _REPLY_GRACE)
+            if line is None:
+                self._kill()
+                raise subprocess.TimeoutExpired(argv, timeout)
+        if not line:
+            # Reap it so ``alive`` reports the death straight away
+            code = self._kill()
+            raise RuntimeError(f"Emulator worker exited (code {code})")
+
+        reply = json.loads(line)
+        if reply["timed_out"]:
+            raise subprocess.TimeoutExpired(argv, timeout, reply["stdout"], reply["stderr"])
+        return subprocess.CompletedProcess(argv, reply["returncode"], reply["stdout"], reply["stderr"])
+
+    def _read_reply(self, timeout: float) -> Optional[str]:
+        """Read one reply line; None if none starts within timeout."""
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._proc.stdout, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                return None
+        return self._proc.stdout.readline()
+
+    def _kill(self) -> int:
+        """Kill the worker and any child it forked; returns its exit code."""
+        try:
+            os.killpg(self._proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        return self._proc.wait()
+
+    @property
+    def alive(self) -> bool:
+        """True while the worker process is running."""
+        return self._proc.poll() is None
+
+    def close(self):
+        """Stop the worker process."""
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        self._proc.wait()
+        self._proc.stdout.close()
+
+
+if __name__ == "__main__":
+    serve()
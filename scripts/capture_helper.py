@@ -0,0 +1,139 @@
+"""Capture one device screenshot with the full emulator UI.
+
+capture_screenshots.py imports capture() and runs it in a fresh worker
+process per device; it can also be run on its own:
+
+    python scripts/capture_helper.py --device tufty --app apps/tufty/hello_badge.py --output screenshots/tufty.png
+
+Starts the app with pygame's dummy video driver, waits for it to render,
+then saves the whole emulator window. Prints "OK" or "FAIL: <reason>".
+"""
+
+import argparse
+import os
+import runpy
+import sys
+import threading
+from pathlib import Path
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+sys.path.insert(0, os.getcwd())
+
+import pygame  # noqa: E402
+
+from emulator import _emulator_state  # noqa: E402
+from emulator.devices import get_device  # noqa: E402
+from emulator.display import create_display  # noqa: E402
+from emulator.hardware.buttons import ButtonManager  # noqa: E402
+from emulator.hardware.sensors import SensorManager  # noqa: E402
+from emulator.hardware.touch import TouchManager  # noqa: E402
+from emulator.mocks import install_badgeware_mocks, install_inky_mocks, install_mocks, setup_vfs  # noqa: E402
+
+
+def capture(device_name: str, app: str, output: str) -> bool:
+    """Run app on device_name and save the emulator window to output."""
+    device = get_device(device_name)
+    _emulator_state["device"] = device
+    _emulator_state["running"] = True
+    _emulator_state["headless"] = False
+    _emulator_state["trace"] = False
+    _emulator_state["max_frames"] = 0
+
+    library_type = getattr(device, "library_type", None)
+    if library_type == "inky":
+        install_inky_mocks()
+    elif library_type == "badgeware":
+        install_badgeware_mocks()
+    else:
+        install_mocks()
+
+    if "badger" in app.lower():
+        setup_vfs(app)
+
+    display = create_display(device, headless=False)
+    _emulator_state["display"] = display
+    display.init()
+
+    # Counts frames as soon as the app starts rendering them (e-ink displays
+    # keep render() busy for the whole refresh animation) and wakes the
+    # waits below, again once each frame is published
+    frames = threading.Condition()
+    rendered = 0
+    _render = display.render
+
+    def render(buffer):
+        nonlocal rendered
+        with frames:
+            rendered += 1
+            frames.notify_all()
+        _render(buffer)
+        with frames:
+            frames.notify_all()
+
+    display.render = render
+
+    ButtonManager(device)
+    TouchManager(device)
+    SensorManager(device)
+
+    app_path = Path(app)
+
+    def app_thread():
+        try:
+            app_dir = str(app_path.parent.absolute())
+            if app_dir not in sys.path:
+                sys.path.insert(0, app_dir)
+            runpy.run_path(str(app_path), run_name="__main__")
+        except Exception:
+            pass
+        finally:
+            _emulator_state["running"] = False
+
+    thread = threading.Thread(target=app_thread, daemon=True)
+    thread.start()
+
+    # Wait for first frame
+    with frames:
+        frames.wait_for(lambda: rendered > 0, timeout=10.0)
+    pygame.event.pump()
+
+    # Let it settle: a few more frames, or up to 0.3s for apps that draw once
+    settle_frames = int(os.environ.get("EMU_SETTLE_FRAMES", "3"))
+    with frames:
+        target = rendered + settle_frames
+        frames.wait_for(lambda: rendered >= target, timeout=0.3)
+    pygame.event.pump()
+
+    # A slow first frame (large TFTs) may still be converting; only TFT
+    # displays have no surface until it is published
+    with frames:
+        frames.wait_for(lambda: display.get_surface() is not None, timeout=10.0)
+
+    # Draw the latest frame into the window (normally done by the main loop)
+    display.tick()
+
+    # Save full window screenshot
+    ok = display._window is not None
+    if ok:
+        pygame.image.save(display._window, output)
+        print("OK")
+    else:
+        print("FAIL: no window")
+
+    _emulator_state["running"] = False
+    thread.join(timeout=1.0)
+    display.close()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Capture one device screenshot")
+    parser.add_argument("--device", required=True, help="Device to emulate")
+    parser.add_argument("--app", required=True, help="App to run")
+    parser.add_argument("--output", required=True, help="PNG file to write")
+    args = parser.parse_args()
+    return 0 if capture(args.device, args.app, args.output) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
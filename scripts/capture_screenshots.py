@@ -2,11 +2,20 @@
 
 Runs each demo app with pygame's dummy video driver, waits for
 the first frame to render, then saves the full window as a screenshot.
+
+Usage:
+    python scripts/capture_screenshots.py            # every device
+    python scripts/capture_screenshots.py tufty      # just these devices
 """
 
+import argparse
+import contextlib
+import io
+import multiprocessing
 import os
-import subprocess
-import sys
+
+# Imports pygame and the emulator once, so forked workers start with them
+from capture_helper import capture
 
 APPS = [
     ("tufty", "apps/tufty/hello_badge.py"),
@@ -18,118 +27,61 @@ APPS = [
 
 SCREENSHOT_DIR = "screenshots"
 
-HELPER_TEMPLATE = '''
-import sys, os, time
-os.environ["SDL_VIDEODRIVER"] = "dummy"
-sys.path.insert(0, os.getcwd())
-
-from emulator import _emulator_state
-from emulator.devices import get_device
-from emulator.display import create_display
-from emulator.hardware.buttons import ButtonManager
-from emulator.hardware.touch import TouchManager
-from emulator.hardware.sensors import SensorManager
-from emulator.hardware.wifi import WiFiManager
-from emulator.mocks import install_mocks, install_inky_mocks, install_badgeware_mocks, setup_vfs
-import runpy, threading
-from pathlib import Path
-
-device = get_device("{device}")
-_emulator_state["device"] = device
-_emulator_state["running"] = True
-_emulator_state["headless"] = False
-_emulator_state["trace"] = False
-_emulator_state["max_frames"] = 0
-
-library_type = getattr(device, "library_type", None)
-if library_type == "inky":
-    install_inky_mocks()
-elif library_type == "badgeware":
-    install_badgeware_mocks()
-else:
-    install_mocks()
-
-if "badger" in "{app}".lower():
-    setup_vfs("{app}")
-
-display = create_display(device, headless=False)
-_emulator_state["display"] = display
-display.init()
-
-button_manager = ButtonManager(device)
-touch_manager = TouchManager(device)
-sensor_manager = SensorManager(device)
-
-app_path = Path("{app}")
-
-def app_thread():
+
+def _capture_one(task):
+    """Capture one device in a pool worker; returns (device, lines to report)."""
+    device, app = task
+    output = os.path.join(SCREENSHOT_DIR, f"{device}.png")
+    out = io.StringIO()
+    lines = []
     try:
-        app_dir = str(app_path.parent.absolute())
-        if app_dir not in sys.path:
-            sys.path.insert(0, app_dir)
-        runpy.run_path(str(app_path), run_name="__main__")
-    except Exception:
-        pass
-    finally:
-        _emulator_state["running"] = False
-
-thread = threading.Thread(target=app_thread, daemon=True)
-thread.start()
-
-import pygame
-
-# Wait for first frame
-for _ in range(200):
-    for event in pygame.event.get():
-        pass
-    if display.get_frame_count() > 0:
-        break
-    time.sleep(0.05)
-
-# Let it settle
-time.sleep(0.3)
-for event in pygame.event.get():
-    pass
-
-# Save full window screenshot
-if display._window:
-    pygame.image.save(display._window, "{output}")
-    print("OK")
-else:
-    print("FAIL: no window")
-
-_emulator_state["running"] = False
-thread.join(timeout=1.0)
-display.close()
-'''
+        with contextlib.redirect_stdout(out):
+            capture(device, app, output)
+    except Exception as e:
+        lines.append(f"ERROR: {e}")
+    # Report the capture's meaningful output
+    return device, [line.strip() for line in out.getvalue().splitlines() if line.strip()] + lines
+
+
+def _report(device, lines):
+    print(f"Capturing {device}...", end=" ")
+    for line in lines:
+        print(line)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Capture emulator screenshots")
+    parser.add_argument("devices", nargs="*", help="Devices to capture (default: all)")
+    args = parser.parse_args()
+    known = [device for device, _app in APPS]
+    for device in args.devices:
+        if device not in known:
+            parser.error(f"unknown device {device!r} (choose from {', '.join(known)})")
+    tasks = [(device, app) for device, app in APPS if not args.devices or device in args.devices]
+
     os.makedirs(SCREENSHOT_DIR, exist_ok=True)
-    for device, app in APPS:
-        output = os.path.join(SCREENSHOT_DIR, f"{device}.png")
-        print(f"Capturing {device}...", end=" ")
-        helper = HELPER_TEMPLATE.format(device=device, app=app, output=output)
+    # A single capture runs right here; the pool would only add a fork
+    if len(tasks) == 1:
+        _report(*_capture_one(tasks[0]))
+        return
+
+    # Mocks and pygame are process-wide, so every capture gets a fresh
+    # worker (maxtasksperchild=1); forking keeps the imports done above
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+    pending = [device for device, _app in tasks]
+    with context.Pool(processes=len(tasks), maxtasksperchild=1) as pool:
+        results = pool.imap_unordered(_capture_one, tasks)
         try:
-            proc = subprocess.run(
-                [sys.executable, "-c", helper],
-                timeout=30,
-                capture_output=True,
-                text=True,
-                env={**os.environ, "SDL_VIDEODRIVER": "dummy"},
-            )
-            # Print last meaningful line
-            for line in proc.stdout.strip().splitlines():
-                if line.strip():
-                    print(line.strip())
-            if proc.returncode != 0:
-                for line in proc.stderr.splitlines():
-                    if "error" in line.lower() or "Error" in line:
-                        print(f"  {line.strip()}")
-        except subprocess.TimeoutExpired:
-            print("TIMEOUT")
-        except Exception as e:
-            print(f"ERROR: {e}")
+            for _ in tasks:
+                device, lines = results.next(timeout=30)
+                pending.remove(device)
+                _report(device, lines)
+        except multiprocessing.TimeoutError:
+            for device in pending:
+                print(f"Capturing {device}... TIMEOUT")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+"""Tests for Button state as driven by the emulator's input handling."""
+
+import pytest
+
+from emulator import _emulator_state
+from emulator.devices import get_device
+from emulator.hardware.buttons import ButtonManager
+from emulator.mocks.pimoroni import Button
+
+
+@pytest.fixture(autouse=True)
+def _isolate_emulator_state():
+    """Snapshot+restore shared state so registered buttons don't leak."""
+    saved_state = dict(_emulator_state)
+    _emulator_state.clear()
+    yield
+    _emulator_state.clear()
+    _emulator_state.update(saved_state)
+
+
+def test_fast_repress_is_not_dropped():
+    """A press right after a release registers (there is no bounce to filter)."""
+    button = Button(7)
+    button._press()
+    button._release()
+    button._press()
+    assert button.read()
+    assert button.raw()
+
+
+def test_back_to_back_clicks_through_button_manager():
+    """Release then immediate re-press, as two click_button() calls do."""
+    device = get_device("tufty")
+    manager = ButtonManager(device)
+    pin = device.get_button_by_key("a").pin
+
+    manager.handle_key_down("a")
+    manager.handle_key_up("a")
+    manager.handle_key_down("a")
+    assert manager.is_pressed(pin)
+    assert _emulator_state["buttons"][pin].read()
+
+    manager.handle_key_up("a")
+    assert not manager.is_pressed(pin)
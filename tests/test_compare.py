@@ -0,0 +1,119 @@
+"""Tests for the visual regression image comparison."""
+
+import math
+import os
+import random
+
+import pytest
+from PIL import Image
+
+from emulator import _emulator_state
+from emulator.testing import compare
+
+
+@pytest.fixture(autouse=True)
+def _isolate_emulator_state():
+    saved_state = dict(_emulator_state)
+    _emulator_state.clear()
+    yield
+    _emulator_state.clear()
+    _emulator_state.update(saved_state)
+
+
+def _noise(size, seed):
+    rng = random.Random(seed)
+    return Image.frombytes("RGB", size, bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 3)))
+
+
+def _nudged(img, seed):
+    """Copy of img with small and large per-pixel colour changes mixed in."""
+    rng = random.Random(seed)
+    data = bytes(max(0, min(255, c + rng.choice((0, 0, 3, -5, 7, 40, -200)))) for c in img.tobytes())
+    return Image.frombytes("RGB", img.size, data)
+
+
+def _reference_diff(img1, img2):
+    """Straightforward per-pixel version of the comparison rule."""
+    matching = 0
+    out = []
+    data1, data2 = img1.tobytes(), img2.tobytes()
+    for i in range(0, len(data1), 3):
+        dist2 = sum((a - b) ** 2 for a, b in zip(data1[i:i + 3], data2[i:i + 3]))
+        if dist2 < 100:
+            matching += 1
+            out.append((0, 0, 0))
+        else:
+            intensity = min(255, math.isqrt(dist2))
+            out.append((255, intensity, intensity))
+    diff = Image.new("RGB", img1.size)
+    diff.putdata(out)
+    return matching, diff
+
+
+def test_diff_matches_per_pixel_rule():
+    img1 = _noise((37, 23), seed=0)
+    img2 = _nudged(img1, seed=1)
+
+    matched, diff = compare._diff_images(img1, img2)
+    expected_matched, expected_diff = _reference_diff(img1, img2)
+
+    assert 0 < matched < 37 * 23
+    assert matched == expected_matched
+    assert diff.tobytes() == expected_diff.tobytes()
+
+
+def test_diff_of_a_changed_region():
+    img1 = _noise((40, 30), seed=4)
+    img2 = img1.copy()
+    img2.paste(_nudged(img1.crop((5, 7, 20, 12)), seed=5), (5, 7))
+
+    matched, diff = compare._diff_images(img1, img2)
+    expected_matched, expected_diff = _reference_diff(img1, img2)
+
+    assert 40 * 30 - 15 * 5 <= matched < 40 * 30
+    assert matched == expected_matched
+    assert diff.tobytes() == expected_diff.tobytes()
+
+
+def test_compare_images_threshold():
+    img = _noise((20, 10), seed=2)
+    assert compare.compare_images(img, img.copy())[:2] == (True, 1.0)
+
+    match, similarity, diff = compare.compare_images(img, Image.new("RGB", (20, 10)))
+    assert not match
+    assert similarity < 0.5
+    assert diff.size == (20, 10)
+
+
+def test_compare_images_size_mismatch(tmp_path):
+    path = tmp_path / "small.png"
+    Image.new("P", (8, 4)).save(path)
+
+    match, similarity, diff = compare.compare_images(path, _noise((10, 3), seed=3))
+    assert (match, similarity) == (False, 0.0)
+    assert diff.size == (10, 4)
+    assert diff.getpixel((9, 3)) == (255, 0, 0)
+
+
+class _StubDisplay:
+    def __init__(self, image):
+        self.image = image
+
+    def get_surface(self):
+        return self.image
+
+
+def test_assert_display_matches_reloads_changed_reference(tmp_path):
+    path = tmp_path / "expected.png"
+    red = Image.new("RGB", (6, 4), (255, 0, 0))
+    red.save(path)
+    _emulator_state["display"] = _StubDisplay(red)
+
+    assert compare.assert_display_matches(path)
+    cached = compare._load_expected(path)
+    assert compare._load_expected(path) is cached
+
+    Image.new("RGB", (6, 4), (0, 0, 255)).save(path)
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+    with pytest.raises(AssertionError, match="does not match"):
+        compare.assert_display_matches(path)
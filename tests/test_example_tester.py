@@ -0,0 +1,120 @@
+"""Tests for the example tester."""
+
+import os
+import signal
+import subprocess
+
+import pytest
+
+from emulator.testing import example_tester
+from emulator.testing import worker as worker_module
+
+RENDERED = "Emulator finished. Rendered 3 frames.\n"
+
+
+class _FakeWorker:
+    """Worker stand-in; the first ``dead`` instances start dead."""
+
+    instances = []
+    dead = 0
+
+    def __init__(self, cwd):
+        self.alive = len(_FakeWorker.instances) >= _FakeWorker.dead
+        self.closed = False
+        self.runs = 0
+        _FakeWorker.instances.append(self)
+
+    def run(self, argv, timeout):
+        if not self.alive:
+            raise RuntimeError("Emulator worker exited (code -9)")
+        self.runs += 1
+        return subprocess.CompletedProcess(argv, 0, RENDERED, "")
+
+    def close(self):
+        self.closed = True
+
+
+def test_dead_worker_is_replaced(tmp_path, monkeypatch):
+    for name in ("one.py", "two.py", "three.py"):
+        (tmp_path / name).write_text("pass\n")
+    fallbacks = []
+
+    def fake_run(cmd, **kwargs):
+        fallbacks.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, RENDERED, "")
+
+    monkeypatch.setattr(_FakeWorker, "instances", [])
+    monkeypatch.setattr(_FakeWorker, "dead", 1)
+    monkeypatch.setattr(example_tester, "Worker", _FakeWorker)
+    monkeypatch.setattr(example_tester.subprocess, "run", fake_run)
+
+    report = example_tester.run_tests([str(tmp_path)], jobs=1)
+
+    assert report.passed == 3
+    # The example that hit the dead worker ran in a new interpreter instead
+    assert len(fallbacks) == 1
+    dead, replacement = _FakeWorker.instances
+    assert dead.closed
+    assert replacement.runs == 2
+
+
+@pytest.mark.parametrize("output, expected", [
+    # A lower-priority signature earlier on the line must not hide a later one
+    (
+        "FileNotFoundError: [Errno 2] No such file: 'x.py' AttributeError: 'Foo' object has no attribute 'bar'",
+        ("attribute", None, "Foo.bar", "Missing: Foo.bar"),
+    ),
+    (
+        "TypeError: bad thing; NameError: name 'zz' is not defined",
+        ("name", None, "zz", "Undefined name: zz"),
+    ),
+    (
+        "SyntaxError: oops\nModuleNotFoundError: No module named 'picographics'",
+        ("import", "picographics", None, "Missing module: picographics"),
+    ),
+    ("TypeError: f() takes 1 argument", ("type", None, None, "TypeError: f() takes 1 argument")),
+])
+def test_categorize_error_priority(output, expected):
+    assert example_tester.categorize_error(output, "") == expected
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="workers need os.fork")
+def test_wedged_worker_times_out(monkeypatch):
+    monkeypatch.setattr(worker_module, "_REPLY_GRACE", 0.0)
+    worker = worker_module.Worker(example_tester._PROJECT_ROOT)
+    try:
+        os.kill(worker._proc.pid, signal.SIGSTOP)  # never answers
+        with pytest.raises(subprocess.TimeoutExpired):
+            worker.run(["--list-devices"], 0.2)
+        assert not worker.alive
+    finally:
+        worker.close()
+
+
+@pytest.mark.parametrize("cpus, expected", [(64, 2), (None, 1)])
+def test_workers_are_capped_by_examples(tmp_path, monkeypatch, cpus, expected):
+    for name in ("one.py", "two.py"):
+        (tmp_path / name).write_text("pass\n")
+    monkeypatch.setattr(_FakeWorker, "instances", [])
+    monkeypatch.setattr(example_tester, "Worker", _FakeWorker)
+    monkeypatch.setattr(example_tester.os, "cpu_count", lambda: cpus)
+
+    report = example_tester.run_tests([str(tmp_path)])
+
+    assert report.passed == 2
+    assert len(_FakeWorker.instances) == expected
+
+
+def test_frames_found_before_trailing_output(tmp_path, monkeypatch):
+    example = tmp_path / "app.py"
+    example.write_text("pass\n")
+    stdout = RENDERED + "x" * 2000 + "\natexit: cleaned up\n"
+
+    def fake_run(cmd, **kwargs):
+        return subprocess.CompletedProcess(cmd, 0, stdout, "")
+
+    monkeypatch.setattr(example_tester.subprocess, "run", fake_run)
+    result = example_tester.test_example(example)
+
+    assert result.status == "pass"
+    assert result.frames == 3
@@ -0,0 +1,213 @@
+"""Tests for the PicoVector mock's polygon rasterisation."""
+
+import os
+import random
+import struct
+
+import pytest
+
+from emulator import _emulator_state
+from emulator.mocks import picovector
+from emulator.mocks.picographics import PicoGraphics
+from emulator.mocks.picovector import PicoVector, Polygon, Transform, _is_convex
+
+
+@pytest.fixture(autouse=True)
+def _isolate_emulator_state():
+    saved_state = dict(_emulator_state)
+    _emulator_state.clear()
+    yield
+    _emulator_state.clear()
+    _emulator_state.update(saved_state)
+
+
+def _make_vector(width=64, height=48):
+    display = PicoGraphics(width=width, height=height)
+    display.set_pen(0x000000)
+    display.clear()
+    display.set_pen(0xFFFFFF)
+    return display, PicoVector(display)
+
+
+def _lit(display):
+    return {
+        (x, y)
+        for y, row in enumerate(display.get_buffer())
+        for x, v in enumerate(row)
+        if v
+    }
+
+
+def _render(fill, points):
+    display, vector = _make_vector()
+    getattr(vector, fill)(points)
+    return _lit(display)
+
+
+def test_convex_fill_matches_scanline_fill():
+    """The edge-walking fast path must light exactly the same pixels."""
+    rng = random.Random(1234)
+    for _ in range(200):
+        poly = Polygon()
+        shape = rng.choice(("rectangle", "regular", "circle"))
+        if shape == "rectangle":
+            poly.rectangle(rng.uniform(-10, 50), rng.uniform(-10, 40), rng.uniform(1, 40), rng.uniform(1, 30))
+        elif shape == "regular":
+            poly.regular(rng.uniform(-5, 70), rng.uniform(-5, 50), rng.uniform(2, 30), rng.randint(3, 9))
+        else:
+            poly.circle(rng.uniform(-5, 70), rng.uniform(-5, 50), rng.uniform(1, 25))
+        assert poly._convex
+
+        points = [(int(x), int(y)) for x, y in poly._paths[0]]
+        assert _render("_fill_convex_polygon", points) == _render("_fill_polygon", points)
+
+
+def test_non_convex_shapes_use_general_fill():
+    assert not Polygon().star(10, 10, 5, 3, 8)._convex
+    assert not Polygon().arc(10, 10, 8, 0, 90)._convex
+    assert Polygon().circle(10, 10, 5).path((0, 0), (4, 0), (2, 3))._convex
+    assert not Polygon().circle(10, 10, 5).path((0, 0), (4, 0), (2, 1), (2, 3))._convex
+
+
+def test_stroked_rectangle_leaves_interior_unfilled():
+    display, vector = _make_vector()
+    vector.draw(Polygon().rectangle(10, 10, 20, 12, stroke=2))
+    lit = _lit(display)
+
+    assert (10, 10) in lit and (29, 21) in lit
+    assert (11, 15) in lit and (29, 15) in lit
+    assert not any(13 <= x <= 27 and 13 <= y <= 19 for x, y in lit)
+
+
+def test_is_convex_classification():
+    assert _is_convex([(0, 0), (10, 0), (10, 10), (0, 10)])
+    assert _is_convex([(0, 10), (10, 10), (10, 0), (0, 0)])
+    # Concave "L" and a self-intersecting pentagram
+    assert not _is_convex([(0, 0), (4, 0), (4, 6), (10, 6), (10, 10), (0, 10)])
+    star = [(5, 0), (8, 10), (0, 4), (10, 4), (2, 10)]
+    assert not _is_convex(star)
+
+
+def _write_af_font(path):
+    """Write a one-glyph .af font: 'A' as a convex square plus a concave 'L'."""
+    square = [(0, 0), (60, 0), (60, 60), (0, 60)]
+    ell = [(70, 0), (80, 0), (80, 50), (110, 50), (110, 60), (70, 60)]
+    data = b"af!?" + struct.pack(">HHHH", 0, 1, 2, len(square) + len(ell))
+    data += struct.pack(">HbbBBBB", ord("A"), 0, 0, 110, 60, 120, 2)
+    data += bytes([len(square), len(ell)])
+    data += bytes(c for pt in square + ell for c in pt)
+    path.write_bytes(data)
+
+
+def test_af_font_glyphs_classified_and_rendered(tmp_path):
+    font = tmp_path / "test.af"
+    _write_af_font(font)
+    display, vector = _make_vector(200, 80)
+    assert vector.set_font(str(font), 64)
+    assert vector._af_font[ord("A")]["convex"] == [True, False]
+
+    vector.text("A", 0, 0)
+    lit = _lit(display)
+    assert (10, 10) in lit and (37, 15) in lit
+    assert (50, 27) in lit
+    assert (45, 5) not in lit
+
+
+@pytest.mark.parametrize("mirror", [None, (150.3, 0, -1, 1), (0, 75.6, 1, -1)])
+def test_glyph_cache_matches_direct_rasterisation(tmp_path, mirror):
+    font = tmp_path / "test.af"
+    _write_af_font(font)
+
+    def render(cache_size):
+        display, vector = _make_vector(200, 80)
+        if mirror:
+            # Negative scales put the glyph's local coordinates below zero
+            tx, ty, sx, sy = mirror
+            t = Transform()
+            t.translate(tx, ty)
+            t.scale(sx, sy)
+            vector.set_transform(t)
+        vector.set_font(str(font), 37)
+        vector._glyph_cache_size = cache_size
+        vector.text("AA\nA", 3.3, 2.6)
+        return _lit(display), vector
+
+    direct, _ = render(0)
+    cached, vector = render(512)
+    assert direct
+    assert cached == direct
+    assert 1 <= len(vector._glyph_cache) <= 3
+
+
+def test_glyph_cache_hits_for_moving_text(tmp_path):
+    font = tmp_path / "test.af"
+    _write_af_font(font)
+    display, vector = _make_vector(200, 80)
+    vector.set_font(str(font), 37)
+
+    # Scrolling by arbitrary sub-pixel steps reuses a few phases
+    for step in range(100):
+        vector.text("A", 3 + step * 0.37, 2.6)
+    assert len(vector._glyph_cache) <= picovector._GLYPH_PHASES
+
+
+def test_offscreen_paths_are_skipped(monkeypatch):
+    display, vector = _make_vector()
+    filled = []
+    monkeypatch.setattr(vector, "_fill_convex_polygon", filled.append)
+
+    poly = Polygon().rectangle(-40, 5, 20, 20).rectangle(70, 5, 10, 10).rectangle(-5, -5, 10, 10)
+    vector.draw(poly)
+    assert len(filled) == 1
+
+
+def test_transform_composition():
+    t = Transform()
+    t.translate(10, 20)
+    t.scale(2)
+    t.rotate(90)
+    x, y = t.apply(1, 0)
+    assert (round(x, 9), round(y, 9)) == (10, 22)
+
+    copy = Transform()
+    copy._matrix = t._matrix[:]
+    copy.translate(1, 0)
+    assert t.apply(0, 0) == (10, 20)
+    assert copy.apply(0, 0) != t.apply(0, 0)
+
+
+def test_svg_paths_are_cached_until_file_changes(tmp_path, monkeypatch):
+    svg = tmp_path / "box.svg"
+    svg.write_text('<svg xmlns="http://www.w3.org/2000/svg"><rect x="1" y="2" width="10" height="5"/></svg>')
+    parses = []
+    real_parse = picovector._parse_svg
+    monkeypatch.setattr(picovector, "_parse_svg", lambda path: parses.append(path) or real_parse(path))
+
+    first = Polygon.from_svg(str(svg))
+    second = Polygon.from_svg(str(svg))
+    assert len(parses) == 1
+    assert first._paths == second._paths and first._paths is not second._paths
+
+    os.utime(svg, ns=(0, 12345))
+    Polygon.from_svg(str(svg))
+    assert len(parses) == 2
+
+
+def test_sample_bezier_matches_svgelements():
+    import svgelements
+
+    for seg in (
+        svgelements.CubicBezier((0, 0), (10, 30), (40, -5), (50, 20)),
+        svgelements.QuadraticBezier((0, 0), (10, 30), (50, 20)),
+    ):
+        points = picovector._sample_bezier(seg, 9)
+        expected = [seg.point(i / 9) for i in range(1, 10)]
+        flat = [c for pt in points for c in pt]
+        assert flat == pytest.approx([c for p in expected for c in (p.x, p.y)])
+
+
+def test_span_writes_respect_display_clip():
+    display, vector = _make_vector()
+    display.set_clip(10, 10, 5, 5)
+    vector.draw(Polygon().rectangle(0, 0, 40, 40))
+    assert _lit(display) == {(x, y) for x in range(10, 15) for y in range(10, 15)}
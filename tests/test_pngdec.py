@@ -0,0 +1,70 @@
+"""Tests for the pngdec mock's rendering paths."""
+
+import io
+import random
+
+import pytest
+from PIL import Image
+
+from emulator import _emulator_state
+from emulator.mocks.picographics import PicoGraphics
+from emulator.mocks.pngdec import PNG
+
+
+@pytest.fixture(autouse=True)
+def _isolate_emulator_state():
+    saved_state = dict(_emulator_state)
+    _emulator_state.clear()
+    yield
+    _emulator_state.clear()
+    _emulator_state.update(saved_state)
+
+
+def _png_bytes(mode, size=(30, 20), seed=0):
+    rng = random.Random(seed)
+    img = Image.new("RGBA", size)
+    img.putdata([
+        (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.choice((0, 100, 200, 255)))
+        for _ in range(size[0] * size[1])
+    ])
+    if mode == "P+tRNS":
+        img = img.quantize(64, method=Image.Quantize.FASTOCTREE)
+    elif mode != "RGBA":
+        img = img.convert(mode)
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def _decode(data, *args, per_pixel=False, **kwargs):
+    display = PicoGraphics(width=40, height=30)
+    display.set_pen(0x123456)
+    display.clear()
+    png = PNG(display)
+    png.open_RAM(data)
+    if per_pixel:
+        x, y, scale = args
+        png._render_to_display(png._prepare(scale, 0), x, y)
+    else:
+        png.decode(*args, **kwargs)
+    return display.get_buffer()
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "RGB", "L", "P", "P+tRNS"])
+@pytest.mark.parametrize("x, y, scale", [(0, 0, 1), (-5, -3, 1), (15, 10, 2), (10, -8, -2), (-40, 0, 1)])
+def test_bulk_blit_matches_per_pixel_render(mode, x, y, scale):
+    data = _png_bytes(mode)
+    assert _decode(data, x, y, scale) == _decode(data, x, y, scale, per_pixel=True)
+
+
+def test_repeat_decodes_reuse_prepared_frame():
+    display = PicoGraphics(width=40, height=30)
+    png = PNG(display)
+    png.open_RAM(_png_bytes("RGB"))
+    png.decode(0, 0, 2)
+    png.decode(5, 5, 2)
+    png.decode(0, 0, 1)
+    assert set(png._frames) == {(2, 0), (1, 0)}
+
+    png.open_RAM(_png_bytes("RGB", seed=1))
+    assert png._frames == {}
@@ -86,3 +86,56 @@ def test_presto_touch_scaling_full_res():
     assert touch_a.x == 240
     assert touch_a.y == 240
     assert touch_a.touched is True
+
+
+def test_touch_buttons_follow_primary_and_secondary_touch():
+    from emulator.mocks.touch import FT6236, Button
+
+    Button.clear_buttons()
+    try:
+        left = Button(0, 0, 50, 50)
+        right = Button(100, 100, 20, 20)
+        touch = FT6236(full_res=True)
+
+        _emulator_state["touch_state"] = {"x": 10, "y": 10, "pressed": True}
+        touch.state2, touch.x2, touch.y2 = True, 110, 105
+        touch.poll()
+        assert (left.pressed, right.pressed) == (True, True)
+
+        touch.state2 = False
+        touch.poll()
+        assert (left.pressed, right.pressed) == (True, False)
+
+        _emulator_state["touch_state"] = {"pressed": False}
+        touch.poll()
+        assert (left.pressed, right.pressed) == (False, False)
+    finally:
+        Button.clear_buttons()
+
+
+def test_touch_buttons_rebuilt_under_a_held_touch():
+    import gc
+
+    from emulator.mocks.touch import FT6236, Button
+
+    Button.clear_buttons()
+    try:
+        touch = FT6236(full_res=True)
+        _emulator_state["touch_state"] = {"x": 10, "y": 10, "pressed": True}
+        Button(100, 100, 20, 20)
+        touch.poll()
+
+        # A new screen swaps in the same number of buttons; the finger
+        # hasn't moved, but the new button under it must still register.
+        Button.clear_buttons()
+        under_finger = Button(0, 0, 50, 50)
+        touch.poll()
+        assert under_finger.pressed
+
+        # Buttons nobody holds on to are dropped from the registry
+        for _ in range(10):
+            Button(0, 0, 1, 1)
+        gc.collect()
+        assert list(Button.buttons) == [under_finger]
+    finally:
+        Button.clear_buttons()
@@ -0,0 +1,32 @@
+"""Tests for the QwSTPad mock."""
+
+import pytest
+
+from emulator import _emulator_state
+from emulator.mocks import qwstpad
+from emulator.mocks.machine import I2C
+
+
+@pytest.fixture(autouse=True)
+def _isolate_emulator_state():
+    """Snapshot+restore shared state so the pad's registration doesn't leak."""
+    saved_state = dict(_emulator_state)
+    _emulator_state.clear()
+    yield
+    _emulator_state.clear()
+    _emulator_state.update(saved_state)
+
+
+def test_read_buttons_is_a_shared_read_only_view():
+    pad = qwstpad.QwSTPad(I2C(0))
+    _emulator_state["qwstpad_buttons"] = qwstpad.BUTTON_A | qwstpad.BUTTON_U
+
+    buttons = pad.read_buttons()
+    assert [name for name, down in buttons.items() if down] == ["A", "U"]
+    assert list(buttons) == list(qwstpad.BUTTON_MAP)
+    assert pad.read_buttons() is buttons
+    with pytest.raises(TypeError):
+        buttons["A"] = False
+
+    _emulator_state["qwstpad_buttons"] = 0
+    assert not any(pad.read_buttons().values())
@@ -0,0 +1,46 @@
+"""Tests for RGBLEDManager's brightness-scaled LED cache."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from emulator import _emulator_state
+from emulator.devices import get_device
+from emulator.hardware.rgb_led import RGBLEDManager
+
+
+@pytest.fixture(autouse=True)
+def _isolate_emulator_state():
+    """Snapshot+restore shared state so a fake Presto doesn't leak."""
+    saved_state = dict(_emulator_state)
+    _emulator_state.clear()
+    yield
+    _emulator_state.clear()
+    _emulator_state.update(saved_state)
+
+
+def test_get_leds_returns_a_copy():
+    leds = RGBLEDManager(get_device("presto"))
+    leds.set_all(200, 100, 50)
+    leds.set_brightness(0.5)
+
+    first = leds.get_leds()
+    first[0] = (1, 2, 3)
+    first.append((4, 5, 6))
+    assert leds.get_leds() == [(100, 50, 25)] * leds._num_leds
+
+
+def test_unchanged_presto_sync_keeps_the_cache():
+    leds = RGBLEDManager(get_device("presto"))
+    presto = SimpleNamespace(_leds=[(10, 20, 30)] * leds._num_leds, _led_brightness=1.0)
+    _emulator_state["presto"] = presto
+
+    leds.update_from_presto()
+    assert leds.get_leds()[0] == (10, 20, 30)
+    cached = leds._scaled
+    leds.update_from_presto()
+    assert leds._scaled is cached
+
+    presto._leds = [(40, 50, 60)] * leds._num_leds
+    leds.update_from_presto()
+    assert leds.get_leds()[0] == (40, 50, 60)
@@ -0,0 +1,61 @@
+"""Tests for the urequests mock against a local HTTP server."""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from emulator.mocks import urequests
+
+pytest.importorskip("requests")
+
+BODY = b"hello from the server\n" * 64
+
+
+class _GzipHandler(BaseHTTPRequestHandler):
+    """Serves BODY gzip-encoded whenever the client accepts it."""
+
+    def do_GET(self):
+        payload = BODY
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = gzip.compress(BODY)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url():
+    server = HTTPServer(("127.0.0.1", 0), _GzipHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_raw_is_decoded(url):
+    """raw reads the plain body, as MicroPython's socket would."""
+    resp = urequests.get(url)
+    assert resp.raw.read(5) == BODY[:5]
+    assert resp.raw.read() == BODY[5:]
+    resp.close()
+
+
+def test_streamed_raw_is_decoded(url):
+    resp = urequests.get(url, stream=True)
+    assert resp.raw.read() == BODY
+    resp.close()
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_iter_content_yields_the_body(url, stream):
+    resp = urequests.get(url, stream=stream)
+    assert b"".join(resp.iter_content(100)) == BODY
+    resp.close()